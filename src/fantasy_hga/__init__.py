@@ -0,0 +1,12 @@
+"""
+Fantasy NBA 球隊最佳化的共用元件（GA / HGA 腳本共用）
+"""
+from .cache import read_csv_cached
+from .cli import main
+from .eligibility import EligibilityIndex, build_eligibility_index
+from .ga import GeneticAlgorithm
+from .incremental import ScoredTeam
+from .memo import TeamMemo
+from .players import PlayerIndex, build_player_index
+from .scoring import ScoreTable, build_score_table, estimate_double_triple_batch, population_matrix
+from .seasons import SEASONS, load_player_csv, load_player_data
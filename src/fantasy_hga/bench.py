@@ -0,0 +1,274 @@
+"""
+GA 運算元與完整世代的效能基準測試。
+
+    python -m fantasy_hga.bench --output bench.json
+    python -m fantasy_hga.bench --baseline bench.json          # 與基準比較，變慢超過門檻時回傳 1
+    python -m fantasy_hga.bench --save-baseline bench.json     # 把這次結果存為新的基準
+
+    python -m fantasy_hga.bench --seasons --synthetic 1000 10000 100000 --output scaling.json
+
+每個資料集（data/ 中的三個賽季、放大倍數的球員池、合成球員池）都會量測：
+initialize_population、批次 fitness、fitness_function（空快取）、crossover、crossover_population（整批 200 對）、
+repair_duplicates、mutate、mutate_population（整批 200 隊）、local_search 每次呼叫的時間、evolve_population 的每秒世代數，
+以及建立 GeneticAlgorithm 時的記憶體峰值（可用來畫出記憶體與每代時間的規模曲線）。
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from .ga import GeneticAlgorithm
+from .incremental import ScoredTeam
+from .seasons import DATA_DIR, NUMERIC_COLUMNS, SEASONS, load_player_data
+from .synthetic import generate_player_pool
+
+# 比較基準時，變慢超過此比例即視為退步
+DEFAULT_THRESHOLD = 0.10
+
+
+def scaled_player_data(player_data, factor, seed=0):
+    """
+    把球員池放大 factor 倍：每一份複本使用新的 Rk 與名稱，數據乘上 ±10% 的隨機擾動。
+    factor=1 時回傳原本的數據。
+    """
+    if factor <= 1:
+        return player_data
+    rng = np.random.default_rng(seed)
+    max_rk = int(player_data['Rk'].max())
+    copies = [player_data]
+    for copy_index in range(1, factor):
+        copy = player_data.copy()
+        copy['Rk'] = copy['Rk'] + copy_index * max_rk
+        copy['Player'] = copy['Player'] + f" #{copy_index}"
+        noise = rng.uniform(0.9, 1.1, size=(len(copy), len(NUMERIC_COLUMNS)))
+        copy[NUMERIC_COLUMNS] = copy[NUMERIC_COLUMNS].to_numpy(dtype=float) * noise
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def time_calls(function, items, repeat=3):
+    """
+    對 items 中的每個參數呼叫 function，重複 repeat 次，
+    回傳 {'per_call': 最快一次的平均每次呼叫秒數, 'median': 中位數, 'calls': 呼叫次數}。
+    每次重複前以相同種子重設亂數，結果可以互相比較。
+    """
+    totals = []
+    for _ in range(repeat):
+        random.seed(0)
+        np.random.seed(0)
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        totals.append(time.perf_counter() - start)
+    calls = max(len(items), 1)
+    return {'per_call': min(totals) / calls, 'median': statistics.median(totals) / calls, 'calls': len(items)}
+
+
+def benchmark_dataset(ga, repeat=3, generations=3, sample=200):
+    """量測單一資料集的各個運算元，回傳 {名稱: 結果}"""
+    random.seed(0)
+    population = ga.initialize_population()
+    pairs = [(population[i], population[i + 1]) for i in range(0, min(2 * sample, len(population) - 1), 2)]
+    teams = population[:sample]
+
+    # 含重複球員的子代（交叉後、修復前），用來單獨量測 repair_duplicates
+    random.seed(0)
+    raw_children = []
+    for parent1, parent2 in pairs:
+        point = random.randint(1, len(parent1) - 2)
+        raw_children.append(parent1[:point] + parent2[point:])
+
+    def fresh_children():
+        return [ScoredTeam(ga.score_table, team) for team in teams]
+
+    def cold_fitness(team):
+        ga.team_memo.clear()
+        ga.fitness_function(team)
+
+    results = {
+        'initialize_population': time_calls(lambda _: ga.initialize_population(), [None], repeat),
+        'evaluate_population': time_calls(lambda pop: ga.score_table.evaluate_population(pop), [population], repeat),
+        'fitness_function': time_calls(cold_fitness, teams, repeat),
+        'crossover': time_calls(lambda pair: ga.crossover(*pair), pairs, repeat),
+        'crossover_population': time_calls(
+            lambda batch: ga.crossover_population(*batch), [([p[0] for p in pairs], [p[1] for p in pairs])], repeat
+        ),
+        'repair_duplicates': time_calls(ga.repair_duplicates, raw_children, repeat),
+        'mutate_population': time_calls(ga.mutate_population, [teams], repeat),
+        'local_search_population': time_calls(
+            lambda batch: ga.local_search_population([list(team) for team in batch]), [teams], repeat
+        ),
+    }
+    # 突變與局部搜尋會修改球隊，每次重複都使用新的複本（複製的時間不計入）
+    for name, operator in (('mutate', ga.mutate), ('local_search', ga.local_search)):
+        totals = []
+        for _ in range(repeat):
+            children = fresh_children()
+            random.seed(0)
+            start = time.perf_counter()
+            for child in children:
+                operator(child)
+            totals.append(time.perf_counter() - start)
+        results[name] = {'per_call': min(totals) / len(teams), 'median': statistics.median(totals) / len(teams),
+                         'calls': len(teams)}
+
+    # 完整世代：每秒世代數
+    random.seed(0)
+    ga.team_memo.clear()
+    current = [list(team) for team in population]
+    start = time.perf_counter()
+    for generation in range(generations):
+        current = ga.evolve_population(current, generation)[0]
+    elapsed = time.perf_counter() - start
+    results['generation'] = {'per_call': elapsed / generations, 'median': elapsed / generations,
+                             'calls': generations, 'generations_per_sec': generations / elapsed}
+    return results
+
+
+def dataset_name(season, scale):
+    return season if scale == 1 else f"{season}_x{scale}"
+
+
+def synthetic_datasets(sizes, season='end', seed=0):
+    """合成球員池的資料集：(名稱, 賽季設定, player_data)"""
+    return [(f"synthetic_{size}", season, generate_player_pool(size, seed=seed)) for size in sizes]
+
+
+def run_benchmarks(seasons=tuple(SEASONS), scales=(1,), repeat=3, generations=3, data_dir=DATA_DIR,
+                   synthetic=()):
+    """
+    執行所有資料集的基準測試，回傳可存成 JSON 的結果。
+    synthetic 為 (名稱, 賽季設定, player_data) 的序列（例如 synthetic_datasets()），會一併量測。
+    """
+    datasets = []
+    for season in seasons:
+        player_data = load_player_data(season, data_dir)
+        for scale in scales:
+            datasets.append((dataset_name(season, scale), season, scaled_player_data(player_data, scale)))
+    datasets.extend(synthetic)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'generations': generations,
+        },
+        'datasets': {},
+    }
+    for name, season, player_data in datasets:
+        tracemalloc.start()
+        ga = GeneticAlgorithm(season, player_data=player_data)
+        _, build_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results = benchmark_dataset(ga, repeat=repeat, generations=generations)
+        results['players'] = len(ga.player_index)
+        results['memory'] = {
+            'build_peak_bytes': build_peak,
+            'player_data_bytes': int(player_data.memory_usage(deep=True).sum()),
+        }
+        report['datasets'][name] = results
+        print(f"{name}: {len(ga.player_index)} players, {results['generation']['generations_per_sec']:.2f} generations/s")
+    return report
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    與基準比較每個 (資料集, 運算元) 的每次呼叫時間。
+    回傳 (列表, 是否有退步)；列表每列為 (資料集, 運算元, 基準, 目前, 比例, 標記)。
+    """
+    rows = []
+    regressed = False
+    for name, results in current['datasets'].items():
+        base_results = baseline.get('datasets', {}).get(name)
+        if base_results is None:
+            continue
+        for operator, result in results.items():
+            if not isinstance(result, dict) or 'per_call' not in result or operator not in base_results:
+                continue
+            before = base_results[operator]['per_call']
+            after = result['per_call']
+            ratio = after / before if before > 0 else float('inf')
+            flag = ''
+            if ratio > 1 + threshold:
+                flag = 'REGRESSION'
+                regressed = True
+            elif ratio < 1 - threshold:
+                flag = 'faster'
+            rows.append((name, operator, before, after, ratio, flag))
+    return rows, regressed
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def print_comparison(rows):
+    print(f"{'dataset':<12} {'operator':<22} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, operator, before, after, ratio, flag in rows:
+        print(f"{name:<12} {operator:<22} {format_seconds(before):>12} {format_seconds(after):>12} {ratio:>6.2f}x {flag}")
+
+
+def print_results(report):
+    print(f"{'dataset':<12} {'operator':<22} {'per call':>12}")
+    for name, results in report['datasets'].items():
+        for operator, result in results.items():
+            if isinstance(result, dict) and 'per_call' in result:
+                print(f"{name:<12} {operator:<22} {format_seconds(result['per_call']):>12}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='fantasy_hga.bench', description="Benchmark GA operators")
+    parser.add_argument('--seasons', nargs='*', choices=sorted(SEASONS), default=list(SEASONS))
+    parser.add_argument('--scales', nargs='+', type=int, default=[1, 4], help="球員池放大倍數")
+    parser.add_argument('--synthetic', nargs='*', type=int, default=[], metavar='N',
+                        help="另外量測 N 位球員的合成球員池（fantasy_hga.synthetic）")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--generations', type=int, default=3, help="量測每秒世代數時演化的世代數")
+    parser.add_argument('--data-dir', default=str(DATA_DIR))
+    parser.add_argument('--output', default=None, help="結果寫入此 JSON 檔案")
+    parser.add_argument('--baseline', default=None, help="與此 JSON 基準比較")
+    parser.add_argument('--save-baseline', default=None, help="把這次結果存為基準")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="視為退步的變慢比例")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    report = run_benchmarks(args.seasons, args.scales, args.repeat, args.generations, args.data_dir,
+                            synthetic_datasets(args.synthetic))
+    print_results(report)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as handle:
+                json.dump(report, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        rows, regressed = compare(report, baseline, args.threshold)
+        print()
+        print_comparison(rows)
+        if regressed:
+            print(f"\n⚠️ Regression: at least one operator is more than {args.threshold:.0%} slower than the baseline")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 快取格式版本：轉換規則改變時遞增，舊的快取會自動重建
+CACHE_VERSION = 1
+META_KEY = '__meta__'
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """檔案內容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def default_cache_path(csv_path, cache_dir=None):
+    """快取檔案的位置：預設放在 CSV 同一個資料夾下的 .cache/"""
+    csv_path = Path(csv_path)
+    cache_dir = csv_path.parent / '.cache' if cache_dir is None else Path(cache_dir)
+    return cache_dir / f"{csv_path.name}.npz"
+
+
+def column_is_numeric(column, values):
+    """
+    欄位是否為數字欄位：所有非空值都能轉成數字。
+    重複出現的表頭列（值等於欄位名稱）不影響判斷。
+    """
+    numbers = pd.to_numeric(values, errors='coerce')
+    invalid = values.notna() & numbers.isna() & (values.astype(str) != column)
+    return numbers.notna().any() and not invalid.any(), numbers
+
+
+def build_cache(csv_path, cache_path):
+    """
+    解析 CSV 並寫入 .npz 快取：數字欄位存成 float64（無法轉換的值為 NaN），
+    其他欄位存成字串陣列（空值為 ''）。
+    回傳解析後的 DataFrame。
+    """
+    csv_path = Path(csv_path)
+    cache_path = Path(cache_path)
+    stat = csv_path.stat()
+    data = pd.read_csv(csv_path, dtype=str, keep_default_na=False, na_values=[''])
+
+    arrays = {}
+    kinds = {}
+    frame = {}
+    for index, column in enumerate(data.columns):
+        numeric, numbers = column_is_numeric(column, data[column])
+        if numeric:
+            arrays[f"c{index}"] = numbers.to_numpy(dtype=float)
+            kinds[column] = 'f'
+            frame[column] = numbers.astype(float)
+        else:
+            arrays[f"c{index}"] = data[column].fillna('').to_numpy(dtype=str)
+            kinds[column] = 'U'
+            frame[column] = data[column]
+
+    meta = {
+        'version': CACHE_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': file_digest(csv_path),
+        'columns': list(data.columns),
+        'kinds': kinds,
+        'rows': len(data),
+    }
+    write_cache(cache_path, arrays, meta)
+    return pd.DataFrame(frame)
+
+
+def write_cache(cache_path, arrays, meta):
+    """以暫存檔 + os.replace 寫入，不會留下寫到一半的快取；無法寫入時略過"""
+    arrays = dict(arrays)
+    arrays[META_KEY] = np.array(json.dumps(meta))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                np.savez(temp_file, **arrays)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass  # 資料夾無法寫入時直接使用解析結果，下次再重新解析
+
+
+def read_meta(cache_file):
+    return json.loads(str(cache_file[META_KEY]))
+
+
+def check_fresh(meta, csv_path):
+    """
+    快取是否仍對應目前的 CSV，回傳 'fresh' / 'touched' / 'stale'。
+    大小與 mtime 相同時直接使用（fresh）；mtime 改變但內容雜湊相同
+    （例如重新複製檔案）時資料仍有效，只需要更新記錄的 mtime（touched）。
+    """
+    if meta.get('version') != CACHE_VERSION:
+        return 'stale'
+    stat = Path(csv_path).stat()
+    if meta['size'] != stat.st_size:
+        return 'stale'
+    if meta['mtime_ns'] == stat.st_mtime_ns:
+        return 'fresh'
+    if meta['sha256'] == file_digest(csv_path):
+        return 'touched'
+    return 'stale'
+
+
+def read_csv_cached(csv_path, columns=None, cache_dir=None, use_cache=True):
+    """
+    讀取 CSV；有有效的快取時只從 .npz 載入需要的欄位，不重新解析文字。
+    CSV 改變（大小、mtime 與內容雜湊）或快取版本不同時自動重建。
+    數字欄位一律為 float64，無法轉換的值（表頭列、空白列）為 NaN。
+    """
+    csv_path = Path(csv_path)
+    if not use_cache:
+        data = pd.read_csv(csv_path)
+        return data if columns is None else data[list(columns)]
+
+    cache_path = default_cache_path(csv_path, cache_dir)
+    if cache_path.exists():
+        try:
+            with np.load(cache_path, allow_pickle=False) as cache_file:
+                meta = read_meta(cache_file)
+                state = check_fresh(meta, csv_path)
+                if state == 'touched':
+                    meta['mtime_ns'] = csv_path.stat().st_mtime_ns
+                    arrays = {key: cache_file[key] for key in cache_file.files if key != META_KEY}
+                    write_cache(cache_path, arrays, meta)
+                if state != 'stale':
+                    names = meta['columns'] if columns is None else list(columns)
+                    data = {}
+                    for name in names:
+                        values = cache_file[f"c{meta['columns'].index(name)}"]
+                        if meta['kinds'][name] == 'U':
+                            values = pd.Series(values).replace('', np.nan)
+                        data[name] = values
+                    return pd.DataFrame(data)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            pass  # 快取損毀或缺少欄位時重建
+
+    data = build_cache(csv_path, cache_path)
+    return data if columns is None else data[list(columns)]
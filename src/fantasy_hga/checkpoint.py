@@ -0,0 +1,93 @@
+"""
+長時間 GA 的檢查點：每隔幾個世代把可以完整重現後續演化的狀態寫成一個 .npz 檔，
+中斷後以相同的參數重新執行即可從最後一個檢查點接續，結果與沒有中斷時完全相同。
+
+保存的內容：種群（整數矩陣 + 每隊長度）、random 與 NumPy 的亂數狀態、下一個世代的編號、
+每代最佳 fitness、目前最佳球隊、快取統計、提前停止規則的狀態，以及檢查設定是否相同用的指紋。
+Logistic Map 的 x 在每次初始化時由 random 重新產生，random 的狀態已經涵蓋它。
+"""
+import hashlib
+import json
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from .operators import matrix_teams, team_matrix
+
+CHECKPOINT_VERSION = 1
+META_KEY = '__meta__'
+
+
+def data_fingerprint(player_index):
+    """球員名單的雜湊：換了數據檔時球員編號會對不上，不能接續"""
+    digest = hashlib.sha1('\n'.join(player_index.names.tolist()).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def save_checkpoint(path, population, generation, history, best_team, best_fitness, fingerprint, extra=None):
+    """
+    原子寫入檢查點（暫存檔 + os.replace），寫到一半中斷時舊的檢查點仍然完整。
+    extra 為其他可以 JSON 序列化的狀態（快取統計、提前停止規則…）。
+    """
+    matrix, lengths = team_matrix(population)
+    version, internal_state, gauss = random.getstate()
+    np_name, np_keys, np_pos, np_has_gauss, np_cached_gauss = np.random.get_state()
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'generation': generation,
+        'best_team': [int(player_id) for player_id in best_team],
+        'best_fitness': float(best_fitness),
+        'fingerprint': fingerprint,
+        'random_state': [version, list(internal_state), gauss],
+        'numpy_state': [np_name, int(np_pos), int(np_has_gauss), float(np_cached_gauss)],
+        'extra': extra or {},
+    }
+    arrays = {
+        'population': matrix,
+        'lengths': lengths,
+        'history': np.asarray(history, dtype=float),
+        'numpy_keys': np_keys,
+        META_KEY: np.array(json.dumps(meta)),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            np.savez(temp_file, **arrays)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_checkpoint(path, fingerprint=None):
+    """
+    讀取檢查點並還原 random 與 NumPy 的亂數狀態，回傳狀態字典：
+    population, generation, history, best_team, best_fitness, extra。
+    fingerprint 與存檔時不同（設定或數據不同）時丟出 ValueError。
+    """
+    with np.load(path) as checkpoint:
+        meta = json.loads(str(checkpoint[META_KEY]))
+        if meta.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version in {path}")
+        if fingerprint is not None and meta['fingerprint'] != fingerprint:
+            raise ValueError(f"Checkpoint {path} was written with different settings or data")
+        population = matrix_teams(checkpoint['population'], checkpoint['lengths'])
+        history = checkpoint['history'].tolist()
+        numpy_keys = checkpoint['numpy_keys']
+
+    version, internal_state, gauss = meta['random_state']
+    random.setstate((version, tuple(internal_state), gauss))
+    np_name, np_pos, np_has_gauss, np_cached_gauss = meta['numpy_state']
+    np.random.set_state((np_name, numpy_keys, np_pos, np_has_gauss, np_cached_gauss))
+    return {
+        'population': population,
+        'generation': meta['generation'],
+        'history': history,
+        'best_team': meta['best_team'],
+        'best_fitness': meta['best_fitness'],
+        'extra': meta['extra'],
+    }
@@ -0,0 +1,194 @@
+import argparse
+from functools import partial
+
+import numpy as np
+
+from .exact import optimality_gap, solve_optimal_roster
+from .ga import ENGINES, INITIALIZERS, GeneticAlgorithm
+from .harness import run_experiments
+from .islands import TOPOLOGIES
+from .localsearch import LOCAL_SEARCHES
+from .operators import CROSSOVERS
+from .profiling import profile_run
+from .roster import DEFAULT_SLOT_WEIGHTS
+from .seasons import DATA_DIR, POSITIONS_REQUIRED, SEASONS, STARTING_SLOTS, load_player_csv
+from .selection import SELECTIONS
+from .stopping import EarlyStopping
+from .telemetry import Telemetry
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='fantasy_hga',
+        description="Fantasy NBA team optimization with a hybrid genetic algorithm",
+    )
+    parser.add_argument('season', choices=sorted(SEASONS), help="賽季資料：last / mid / end")
+    parser.add_argument('--init', choices=INITIALIZERS, default='chaos',
+                        help="初始化方式：chaos = 混沌初始化（HGA），random = 一般 GA")
+    parser.add_argument('--engine', choices=ENGINES, default='ga',
+                        help="ga / island / exact / sa（模擬退火）/ tabu（禁忌搜尋）")
+    parser.add_argument('--runs', type=int, default=5, help="多輪實驗的輪數")
+    parser.add_argument('--seed', type=int, default=42,
+                        help="主種子：每一輪的種子由此衍生，結果與 worker 數量無關")
+    parser.add_argument('--workers', type=int, default=None, help="平行 worker 數量（預設依 CPU 核心數）")
+    parser.add_argument('--generations', type=int, default=None, help="世代數（預設依賽季設定）")
+    parser.add_argument('--selection', choices=SELECTIONS, default='roulette',
+                        help="親代選擇：roulette（依 fitness 比例）、rank、sigma（sigma scaling）、tournament")
+    parser.add_argument('--tournament-size', type=int, default=3)
+    parser.add_argument('--crossover', choices=CROSSOVERS, default='one_point',
+                        help="交叉方式：one_point（單點）、two_point（兩點）、uniform（均勻）")
+    parser.add_argument('--local-search', choices=LOCAL_SEARCHES, default=None,
+                        help="局部搜尋方式（預設依賽季設定）；best_improvement = 套用進步最多的單一交換直到局部最佳")
+    parser.add_argument('--local-search-moves', type=int, default=10, help="best_improvement 每個子代最多的交換步數")
+    parser.add_argument('--roster-size', type=int, default=len(STARTING_SLOTS),
+                        help=f"球隊的位置數（預設 {len(STARTING_SLOTS)} 個先發位置，最多 {len(POSITIONS_REQUIRED)}）")
+    parser.add_argument('--full-roster', action='store_true',
+                        help="最佳化完整名單：先發、Util、板凳（BN）與傷兵名單（IL / IL+）")
+    parser.add_argument('--bench-weight', type=float, default=DEFAULT_SLOT_WEIGHTS['BN'], help="板凳分數的權重")
+    parser.add_argument('--il-weight', type=float, default=DEFAULT_SLOT_WEIGHTS['IL'],
+                        help="傷兵名單的權重（乘上健康時的分數）")
+    parser.add_argument('--patience', type=int, default=None, help="連續 N 個世代最佳 fitness 沒有進步就停止")
+    parser.add_argument('--plateau-window', type=int, default=None,
+                        help="最近 N 個世代的相對進步小於 --plateau-tol 就停止")
+    parser.add_argument('--plateau-tol', type=float, default=1e-4)
+    parser.add_argument('--target-fitness', type=float, default=None, help="最佳 fitness 達到此值就停止")
+    parser.add_argument('--stop-at-optimum', action='store_true',
+                        help="以精確解的 fitness 作為 --target-fitness（達到真正最佳解就停止）")
+    parser.add_argument('--time-budget', type=float, default=None, metavar='SECONDS', help="每一輪的時間預算")
+    parser.add_argument('--iterations', type=int, default=None, help="sa / tabu 的步數（預設 20000 / 500）")
+    parser.add_argument('--temperature', type=float, default=10.0, help="sa 的起始溫度")
+    parser.add_argument('--final-temperature', type=float, default=0.01, help="sa 的最終溫度")
+    parser.add_argument('--tenure', type=int, default=7, help="tabu：被換下的球員幾步內不能再回到隊中")
+    parser.add_argument('--warm-start', nargs='+', default=(), metavar='PATH',
+                        help="以先前存下的種群檔（--save-population）暖啟動，球員依名稱對應到這份數據")
+    parser.add_argument('--warm-fraction', type=float, default=0.5, help="初始種群中暖啟動球隊的比例")
+    parser.add_argument('--save-population', default=None, metavar='PATH',
+                        help="每一輪結束後把最後的種群（球員名稱）存成 JSON（多輪時加上 .run<N> 後綴）")
+    parser.add_argument('--checkpoint', default=None, metavar='PATH',
+                        help="每 --checkpoint-every 個世代把演化狀態寫入 PATH（.npz，多輪時加上 .run<N> 後綴）")
+    parser.add_argument('--checkpoint-every', type=int, default=10)
+    parser.add_argument('--resume', action='store_true', help="從 --checkpoint 的檢查點接續（沒有檢查點時從頭開始）")
+    parser.add_argument('--islands', type=int, default=4)
+    parser.add_argument('--migration-interval', type=int, default=10, help="每幾個世代遷移一次")
+    parser.add_argument('--migration-size', type=int, default=2, help="每個島嶼每次送出的最佳個體數")
+    parser.add_argument('--topology', choices=TOPOLOGIES, default='ring')
+    parser.add_argument('--data-dir', default=str(DATA_DIR))
+    parser.add_argument('--player-file', default=None, metavar='CSV',
+                        help="改用此球員數據 CSV（例如 fantasy_hga.synthetic 產生的球員池），其餘設定沿用 season")
+    parser.add_argument('--team-column', default='Team', help="--player-file 的球隊欄位名稱")
+    parser.add_argument('--no-cache', action='store_true', help="每次都重新解析 CSV，不使用 .npz 快取")
+    parser.add_argument('--telemetry', default=None, metavar='PATH', help="每個世代的紀錄寫入此 JSONL 檔案")
+    parser.add_argument('--sample-every', type=int, default=1, help="每幾個世代寫一筆 telemetry 紀錄")
+    parser.add_argument('--print-every', type=int, default=10, help="每幾個世代印一行進度（0 = 不印）")
+    parser.add_argument('--profile', action='store_true',
+                        help="記錄每個階段（選擇、交叉、修復、突變、局部搜尋、fitness）的時間，每輪結束時印出明細")
+    parser.add_argument('--cprofile', default=None, metavar='PATH',
+                        help="每一輪的 cProfile 統計寫入 PATH（加上 .run<N> 後綴，可用 snakeviz / pstats 檢視）")
+    parser.add_argument('--flamegraph', default=None, metavar='PATH',
+                        help="以 SIGPROF 取樣呼叫堆疊，collapsed stack 寫入 PATH（加上 .run<N> 後綴，給 flamegraph.pl / speedscope）")
+    parser.add_argument('--sample-interval', type=float, default=0.001, help="堆疊取樣間隔（秒）")
+    parser.add_argument('--no-save', action='store_true', help="不儲存收斂紀錄（.npy）")
+    parser.add_argument('--no-report', action='store_true', help="不繪製圖表")
+    return parser
+
+
+def run(args):
+    """依參數執行多輪實驗，回傳 (GeneticAlgorithm, 各輪結果)"""
+    telemetry = Telemetry(args.telemetry, sample_every=args.sample_every, print_every=args.print_every)
+    player_data = None
+    if args.player_file is not None:
+        player_data = load_player_csv(args.player_file, args.team_column, use_cache=not args.no_cache)
+    stopping = EarlyStopping(
+        patience=args.patience, plateau_window=args.plateau_window, plateau_tol=args.plateau_tol,
+        target_fitness=args.target_fitness, time_budget=args.time_budget
+    )
+    roster_size = len(POSITIONS_REQUIRED) if args.full_roster else args.roster_size
+    slot_weights = None
+    if (args.bench_weight, args.il_weight) != (DEFAULT_SLOT_WEIGHTS['BN'], DEFAULT_SLOT_WEIGHTS['IL']):
+        slot_weights = {'BN': args.bench_weight, 'IL': args.il_weight, 'IL+': args.il_weight}
+    ga = GeneticAlgorithm(
+        args.season, init=args.init, generations=args.generations, data_dir=args.data_dir,
+        use_cache=not args.no_cache, telemetry=telemetry, player_data=player_data, profile=args.profile,
+        stopping=stopping, selection=args.selection, tournament_size=args.tournament_size,
+        crossover_method=args.crossover, local_search=args.local_search, local_search_moves=args.local_search_moves,
+        warm_start=args.warm_start, warm_fraction=args.warm_fraction, population_file=args.save_population,
+        checkpoint_file=args.checkpoint, checkpoint_every=args.checkpoint_every, resume=args.resume,
+        roster_size=roster_size, slot_weights=slot_weights
+    )
+    if args.stop_at_optimum:
+        _, stopping.target_fitness = solve_optimal_roster(ga.score_table, ga.roster_size)
+    num_runs = args.runs
+
+    if args.engine == 'exact':
+        # 精確解每次結果都相同，只需要執行一次
+        num_runs = 1
+        results = run_experiments(ga.exact_solution, num_runs, seed=args.seed, max_workers=1)
+    elif args.engine == 'island':
+        # 島嶼模式本身已使用多個行程，多輪實驗改為依序執行
+        island_run = partial(
+            ga.island_genetic_algorithm, num_islands=args.islands, migration_interval=args.migration_interval,
+            migration_size=args.migration_size, topology=args.topology
+        )
+        results = run_experiments(island_run, num_runs, seed=args.seed, max_workers=1)
+    else:
+        # 各輪實驗在不同行程中平行執行
+        options = {}
+        if args.engine == 'sa':
+            options = {'start_temperature': args.temperature, 'final_temperature': args.final_temperature}
+        elif args.engine == 'tabu':
+            options = {'tenure': args.tenure}
+        if args.engine != 'ga' and args.iterations is not None:
+            options['iterations'] = args.iterations
+        run_function = partial(ga.optimize, args.engine, **options)
+        if args.cprofile or args.flamegraph:
+            run_function = partial(profile_run, run_function, args.cprofile, args.flamegraph, args.sample_interval)
+        results = run_experiments(run_function, num_runs, seed=args.seed, max_workers=args.workers)
+    telemetry.close()
+    return ga, results
+
+
+def summarize(ga, results):
+    """以精確解衡量每一輪與真正最佳解的差距，並印出平均時間與世代數"""
+    optimal_team, optimal_fitness = solve_optimal_roster(ga.score_table, ga.roster_size)
+    print(f"\n📐 Optimal Fitness = {optimal_fitness}")
+    total_time = 0
+    total_generations = 0
+    for result in results:
+        gap = optimality_gap(result['best_fitness'], optimal_fitness)
+        print(f"\n🔁 Run {result['run'] + 1} (seed {result['seed']}): Best Fitness = {result['best_fitness']}, Generations = {result['generations']}, Optimality Gap = {gap:.2%}")
+        total_time += result['time']
+        total_generations += result['generations']
+
+    print(f"\n✅ Average over {len(results)} runs:")
+    print(f"⏱️ Average Time: {total_time / len(results):.2f} seconds")
+    print(f"📈 Average Generations: {total_generations / len(results):.2f}")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    ga, results = run(args)
+    summarize(ga, results)
+
+    # 最後一輪的結果
+    last_run = results[-1]
+    best_team = last_run['best_team']
+    best_fitness_history = last_run['history']
+
+    if not args.no_save:
+        np.save(ga.config['history_files'][args.init], np.array(best_fitness_history))
+
+    # 對最佳球隊重新計算適應度以獲取完整數據
+    _, selected_players = ga.fitness_function(best_team)
+    ideal_team = ga.config['target_players']  # 理想解
+
+    from . import report
+
+    if args.no_report:
+        report.analyze_results_ignore_order(best_team, ideal_team, ga.player_index)
+        report.analyze_injury_impact(selected_players, plot=False)
+    else:
+        report.plot_convergence(best_fitness_history, ga.config['plot_titles'][args.init])
+        # 對結果進行分析並繪製混淆矩陣
+        report.analyze_results_ignore_order_with_plot(best_team, ideal_team, ga.player_index)
+        report.analyze_injury_impact(selected_players)
+    return results
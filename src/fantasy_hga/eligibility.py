@@ -0,0 +1,144 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+# 每個位置一個 bit
+POSITION_BITS = {
+    'PG': 1,
+    'SG': 2,
+    'G': 4,
+    'SF': 8,
+    'PF': 16,
+    'F': 32,
+    'C': 64,
+    'Util': 128,
+    'BN': 256,
+    'IL': 512,
+    'IL+': 1024
+}
+
+# 球員 Pos 代號可以打的位置（G = PG/SG，F = SF/PF，Util 與板凳任何人都可以）
+# IL / IL+ 取決於出賽比例而不是 Pos，由 assign_position 依分數表另外設定
+OPEN_BITS = POSITION_BITS['Util'] | POSITION_BITS['BN']
+TOKEN_ELIGIBILITY = {
+    'PG': POSITION_BITS['PG'] | POSITION_BITS['G'] | OPEN_BITS,
+    'SG': POSITION_BITS['SG'] | POSITION_BITS['G'] | OPEN_BITS,
+    'SF': POSITION_BITS['SF'] | POSITION_BITS['F'] | OPEN_BITS,
+    'PF': POSITION_BITS['PF'] | POSITION_BITS['F'] | OPEN_BITS,
+    'C': POSITION_BITS['C'] | OPEN_BITS
+}
+
+
+def position_masks(pos):
+    """
+    回傳 (可打位置 bitmask, Pos 代號 bitmask)。
+    前者等同原本的 str.contains 判斷（'G' 會吻合 PG/SG），後者只包含 Pos 中實際列出的代號。
+    """
+    if not isinstance(pos, str):
+        return 0, 0
+    eligible = 0
+    tokens = 0
+    for token in pos.split('-'):
+        eligible |= TOKEN_ELIGIBILITY.get(token, 0)
+        tokens |= POSITION_BITS.get(token, 0)
+    return eligible, tokens
+
+
+class EligibilityIndex:
+    """
+    位置資格索引：每位球員一個 bitmask，並為每個位置預先排好候選名單。
+    建立一次後，各個遺傳運算子都只做陣列查詢，不再於世代迴圈內使用 pandas 字串方法。
+    """
+
+    def __init__(self, ids, eligible_masks, token_masks, sort_values):
+        size = int(ids.max()) + 1 if len(ids) else 0
+        self.eligible_masks = np.zeros(size, dtype=np.int64)
+        self.eligible_masks[ids] = eligible_masks
+        self.token_masks = np.zeros(size, dtype=np.int64)
+        self.token_masks[ids] = token_masks
+
+        # ranked[(位置, 排序欄位)]：符合位置的球員編號，依該欄位由高到低排序
+        # exact_ranked 則只收 Pos 代號完全吻合的球員（等同 pos in Pos.split('-')）
+        self.ranked = {}
+        self.exact_ranked = {}
+        self._ordered = {column: ids[np.argsort(-values, kind='stable')] for column, values in sort_values.items()}
+        for column, ordered in self._ordered.items():
+            for position, bit in POSITION_BITS.items():
+                self.ranked[(position, column)] = ordered[(self.eligible_masks[ordered] & bit) != 0]
+                self.exact_ranked[(position, column)] = ordered[(self.token_masks[ordered] & bit) != 0]
+        # best_available 逐一走訪用的 list 版本（需要時才建立）
+        self._ranked_lists = {}
+
+    def assign_position(self, position, player_ids):
+        """
+        把 position 的資格改為 player_ids（例如 IL 只收傷兵），並重建該位置的候選名單。
+        Pos 代號本身不含這類位置，exact 名單與一般名單相同。
+        """
+        bit = POSITION_BITS[position]
+        self.eligible_masks &= ~bit
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        self.eligible_masks[player_ids[player_ids < len(self.eligible_masks)]] |= bit
+        for column, ordered in self._ordered.items():
+            ranked = ordered[(self.eligible_masks[ordered] & bit) != 0]
+            self.ranked[(position, column)] = ranked
+            self.exact_ranked[(position, column)] = ranked
+            self._ranked_lists.pop((position, column), None)
+
+    def is_eligible(self, player_id, position):
+        bit = POSITION_BITS.get(position, 0)
+        return 0 <= player_id < len(self.eligible_masks) and bool(self.eligible_masks[player_id] & bit)
+
+    def candidates(self, position, by='PTS', exact=False):
+        """符合位置的候選球員編號（依 by 欄位由高到低）；沒有對應位置時回傳空陣列"""
+        ranked = self.exact_ranked if exact else self.ranked
+        return ranked.get((position, by), np.empty(0, dtype=np.int64))
+
+    def top(self, position, n, by='PTS', exact=False):
+        """前 n 名候選球員（回傳新的 list，可以直接打散）"""
+        return self.candidates(position, by, exact)[:n].tolist()
+
+    def best_available(self, position, exclude, by='PTS'):
+        """依排序名單找出第一位不在 exclude 中的球員，沒有則回傳 None"""
+        ranked = self._ranked_lists.get((position, by))
+        if ranked is None:
+            ranked = self._ranked_lists[(position, by)] = self.candidates(position, by).tolist()
+        for player_id in ranked:
+            if player_id not in exclude:
+                return player_id
+        return None
+
+    def random_candidate(self, position, exclude, max_attempts=20):
+        """從符合位置的球員中隨機挑一位不在 exclude 中的球員，沒有則回傳 None"""
+        pool = self.candidates(position)
+        if len(pool) == 0:
+            return None
+        for _ in range(max_attempts):
+            player_id = int(pool[random.randrange(len(pool))])
+            if player_id not in exclude:
+                return player_id
+        # 候選人大多已在隊中時，改為先過濾再抽
+        remaining = pool[~np.isin(pool, list(exclude))]
+        if len(remaining) == 0:
+            return None
+        return int(remaining[random.randrange(len(remaining))])
+
+
+def build_eligibility_index(player_data, sort_columns=('PTS', 'AST', 'ORB'), id_column='Rk'):
+    """
+    由球員數據建立 EligibilityIndex。
+    與 ScoreTable 相同，同一個球員編號有多列時只取第一列。
+    """
+    rk = pd.to_numeric(player_data[id_column], errors='coerce')
+    players = player_data[rk.notna()].copy()
+    players[id_column] = rk[rk.notna()].astype(np.int64)
+    players = players.drop_duplicates(subset=id_column, keep='first')
+
+    masks = [position_masks(pos) for pos in players['Pos']]
+    eligible_masks = np.array([m[0] for m in masks], dtype=np.int64)
+    token_masks = np.array([m[1] for m in masks], dtype=np.int64)
+    sort_values = {
+        column: pd.to_numeric(players[column], errors='coerce').fillna(0).to_numpy(dtype=float)
+        for column in sort_columns
+    }
+    return EligibilityIndex(players[id_column].to_numpy(), eligible_masks, token_masks, sort_values)
@@ -0,0 +1,55 @@
+import time
+
+import numpy as np
+
+
+def slot_value_matrix(score_table, roster_size=10):
+    """
+    建立 (位置 x 球員) 的價值矩陣：每格的價值（ScoreTable.slot_value）減去位置不符的懲罰。
+    回傳 (價值矩陣, 對應的球員編號)。
+    """
+    player_ids = np.flatnonzero(score_table.valid)
+    slots = np.arange(roster_size)
+    mismatches = ~score_table.slot_match[slots[:, None], player_ids[None, :]]
+    values = score_table.slot_value[slots[:, None], player_ids[None, :]] - mismatches * score_table.position_penalty
+    return values, player_ids
+
+
+def solve_optimal_roster(score_table, roster_size=10):
+    """
+    以指派問題（linear_sum_assignment）求出 fitness_function 的真正最佳解。
+    每個位置另外準備一個價值為 0 的「空位」，對應 fitness 中重複或找不到的球員（不計分），
+    因此結果就是所有長度為 roster_size 的球隊中 fitness 最高者。
+    回傳 (最佳球隊, 最佳 fitness)；空位以 -1 表示。
+    """
+    from scipy.optimize import linear_sum_assignment  # 只在使用精確解時才載入 scipy
+
+    values, player_ids = slot_value_matrix(score_table, roster_size)
+    empty_slots = np.zeros((roster_size, roster_size))
+    slots, columns = linear_sum_assignment(np.hstack([values, empty_slots]), maximize=True)
+
+    team = [-1] * roster_size
+    for slot, column in zip(slots, columns):
+        if column < len(player_ids):
+            team[slot] = int(player_ids[column])
+    total_score, position_penalty, _ = score_table.score_team(team)
+    return team, total_score - position_penalty
+
+
+def exact_algorithm(score_table, roster_size=10):
+    """
+    精確解引擎，回傳值與 genetic_algorithm 相同：
+    (最佳球隊, 最佳 fitness, 執行時間, 世代數 = 0, 收斂紀錄)。
+    """
+    start_time = time.time()  # ⏱️ 開始計時
+    best_team, best_fitness = solve_optimal_roster(score_table, roster_size)
+    total_time = time.time() - start_time
+    print(f"⏱️ Total execution time: {total_time:.4f} seconds")
+    return best_team, best_fitness, total_time, 0, [best_fitness]
+
+
+def optimality_gap(fitness, optimal_fitness):
+    """與最佳解的差距（比例）"""
+    if optimal_fitness == 0:
+        return 0.0
+    return (optimal_fitness - fitness) / abs(optimal_fitness)
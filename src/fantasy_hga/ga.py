@@ -0,0 +1,680 @@
+import random
+import time
+from functools import partial
+
+import numpy as np
+
+from .checkpoint import data_fingerprint, load_checkpoint, save_checkpoint
+from .eligibility import build_eligibility_index
+from .exact import exact_algorithm
+from .harness import run_output_path
+from .islands import run_islands
+from .localsearch import LOCAL_SEARCHES, OneSwapSearch
+from .memo import TeamMemo
+from .operators import (CROSSOVERS, EMPTY, SlotPools, crossover_matrix, duplicate_rows, matrix_teams, mutate_matrix,
+                        team_matrix)
+from .players import build_player_index
+from .profiling import Profiler
+from .scoring import build_score_table
+from .roster import assign_slot_eligibility
+from .seasons import DATA_DIR, POSITIONS_REQUIRED, SCORING_SYSTEM, SEASONS, STARTING_SLOTS, load_player_data
+from .selection import SELECTIONS, select_parents
+from .stopping import EarlyStopping
+from .telemetry import Telemetry
+from .trajectory import SwapMoves, simulated_annealing, tabu_search
+from .warmstart import load_rosters, remap_rosters, save_population
+
+# 初始化方式：chaos = Logistic Map 混沌初始化（HGA），random = PTS/AST/ORB 前 30 名隨機挑選（GA）
+INITIALIZERS = ('chaos', 'random')
+
+# optimize() 可用的引擎：ga = 單一種群遺傳算法、island = 島嶼模式、exact = 精確解、
+# sa = 模擬退火、tabu = 禁忌搜尋（後兩者為單一解的軌跡式搜尋，使用相同的球隊編碼與 fitness）
+ENGINES = ('ga', 'island', 'exact', 'sa', 'tabu')
+
+
+# 定義 Logistic Map
+def logistic_map(x, r=3.99):
+    return r * x * (1 - x)
+
+
+class GeneticAlgorithm:
+    """
+    單一賽季的遺傳算法。
+    載入時建立一次球員數據、標準球員索引、分數表、位置資格索引與球隊快取，
+    演化運算元與原本各賽季腳本相同，差異只由 SEASONS 設定與 init 決定。
+    球隊中的球員以 PlayerIndex 的連續編號表示（交易球員只有一個編號）。
+    player_data 可直接傳入已載入的球員數據（例如合成的球員池），此時不讀取 data_dir。
+    selection 為親代選擇方式（roulette / rank / sigma / tournament），每個世代一次抽出所有親代；
+    crossover_method 為交叉方式（one_point / two_point / uniform），所有配對一次以矩陣交叉。
+    local_search 覆寫賽季設定的局部搜尋方式；best_improvement 每個子代最多走 local_search_moves 步。
+    warm_start 為先前存下的種群檔（save_population），依名稱對應並修復後取代初始種群的 warm_fraction；
+    population_file 設定時，每一輪結束後把最後的種群存檔（多輪時加上 .run<N> 後綴）。
+    checkpoint_file 設定時每 checkpoint_every 個世代寫一次檢查點；resume=True 時從既有的檢查點接續，
+    結果與沒有中斷時完全相同。
+    stopping（EarlyStopping）設定提前停止規則：停滯世代數、相對進步停滯、已知上限、時間預算。
+    profile=True 時記錄每個階段（選擇、交叉、修復、突變、局部搜尋、fitness…）的時間，並在每一輪結束時印出明細。
+    """
+
+    def __init__(self, season, init='chaos', generations=None, population_size=600, data_dir=DATA_DIR,
+                 use_cache=True, telemetry=None, player_data=None, profile=False,
+                 stopping=None, selection='roulette', tournament_size=3,
+                 crossover_method='one_point', local_search=None, local_search_moves=10, warm_start=(),
+                 warm_fraction=0.5, population_file=None, checkpoint_file=None, checkpoint_every=10, resume=False,
+                 roster_size=len(STARTING_SLOTS), slot_weights=None):
+        if season not in SEASONS:
+            raise ValueError(f"Unknown season: {season}")
+        if init not in INITIALIZERS:
+            raise ValueError(f"Unknown initializer: {init}")
+        if selection not in SELECTIONS:
+            raise ValueError(f"Unknown selection method: {selection}")
+        if crossover_method not in CROSSOVERS:
+            raise ValueError(f"Unknown crossover method: {crossover_method}")
+        if local_search is not None and local_search not in LOCAL_SEARCHES:
+            raise ValueError(f"Unknown local search: {local_search}")
+        if not 1 <= roster_size <= len(POSITIONS_REQUIRED):
+            raise ValueError(f"roster_size must be between 1 and {len(POSITIONS_REQUIRED)}")
+        self.season = season
+        self.config = SEASONS[season]
+        self.init = init
+        self.generations = self.config['generations'] if generations is None else generations
+        self.population_size = population_size
+        self.positions_required = POSITIONS_REQUIRED
+        # 球隊的基因數：預設只填 10 個先發位置，17 為包含 Util、板凳與傷兵名單的完整名單
+        self.roster_size = roster_size
+        self.roster_slots = POSITIONS_REQUIRED[:roster_size]
+        self.slot_weights = slot_weights
+        self.scoring_system = SCORING_SYSTEM
+        self.target_players = set(self.config['target_players'])
+        self.selection = selection
+        self.tournament_size = tournament_size
+        self.crossover_method = crossover_method
+        self.local_search_strategy = self.config['local_search'] if local_search is None else local_search
+        self.local_search_moves = local_search_moves
+
+        if player_data is None:
+            player_data = load_player_data(season, data_dir, use_cache)
+        self.player_data = player_data
+        # 標準球員索引：每位球員一筆資料（交易球員保留 TOT / 2TM 合計列）
+        team_column = next((c for c in (self.config['team_column'], 'Team', 'Tm') if c in player_data), None)
+        self.player_index = build_player_index(self.player_data, team_column)
+        self.players = self.player_index.players
+        # 載入時建立一次賽季分數表（基本分數、雙十/大三元加分、出賽比例、調整後分數）
+        total_games = 'Total_Games' if 'Total_Games' in self.players else 82
+        self.score_table = build_score_table(
+            self.players, SCORING_SYSTEM, POSITIONS_REQUIRED,
+            total_games=total_games, ast_std_ratio=self.config['ast_std_ratio'], id_column='id',
+            slot_weights=slot_weights
+        )
+        # 位置資格索引：每位球員的位置 bitmask 與各位置預先排序的候選名單
+        # Util / BN / IL / IL+ 的資格依分數表設定（任何人 / 傷兵），與 fitness 的規則一致
+        self.eligibility = build_eligibility_index(self.players, id_column='id')
+        assign_slot_eligibility(self.eligibility, self.score_table)
+        # 每個球隊位置的候選陣列（批次突變時一次抽出所有新球員）
+        self.slot_pools = SlotPools(self.eligibility, POSITIONS_REQUIRED)
+        # best-improvement 局部搜尋：每個位置依放在該位置的價值預先排序的候選名單
+        self.swap_search = OneSwapSearch(self.score_table, self.eligibility, POSITIONS_REQUIRED)
+        # 不經過快取的 fitness 評估次數（子代批次計分、best_improvement 的交換），telemetry 的 evals 包含這部分
+        self.evaluations = 0
+        # top_pts / top15_fitness 每個位置換上的球員（第一次局部搜尋時建立）
+        self._local_search_targets = None
+        # 球隊層級的 LRU 快取：重複出現的球隊只需查表一次
+        self.team_memo = TeamMemo(self.score_table)
+        # 每個世代的精簡紀錄（JSONL）與限制頻率的進度輸出
+        self.telemetry = Telemetry() if telemetry is None else telemetry
+        self.population_stats = (0.0, 0.0)
+        # 暖啟動：先前種群的球隊（已對應到這份數據的編號並修復）
+        self.warm_fraction = warm_fraction
+        self.population_file = population_file
+        self.warm_teams = self.load_warm_start(warm_start) if warm_start else []
+        # 檢查點
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be >= 1")
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_every = checkpoint_every
+        self.resume = resume
+        # 分階段計時（關閉時幾乎沒有額外成本）
+        self.profiler = Profiler(enabled=profile)
+        # 提前停止規則（預設不啟用，跑滿設定的世代數）
+        self.stopping = EarlyStopping() if stopping is None else stopping
+
+    def __getstate__(self):
+        # 傳到其他行程時不帶著快取內容，子行程從空的快取開始
+        state = self.__dict__.copy()
+        state['team_memo'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.team_memo = TeamMemo(self.score_table)
+
+    def fitness_function(self, team):
+        # 以分數表做陣列索引計算，相同的球隊直接從快取取出 fitness 與球員明細
+        return self.team_memo.fitness_function(team)
+
+    def team_names(self, team):
+        """球隊中球員名稱（小寫、去除空白）的集合"""
+        return self.player_index.name_set(team)
+
+    # 初始化種群
+    def initialize_population(self, size=None):
+        """建立 size 支球隊（預設 population_size）的初始種群"""
+        if self.init == 'chaos':
+            return self.initialize_chaos_population(size)
+        return self.initialize_random_population(size)
+
+    def initial_population(self, size=None):
+        """每一輪的第一個種群：有暖啟動的球隊時取代前 warm_fraction 的個體"""
+        population = self.initialize_population(size)
+        count = min(len(self.warm_teams), int(round(len(population) * self.warm_fraction)))
+        population[:count] = [list(team) for team in self.warm_teams[:count]]
+        return population
+
+    def load_warm_start(self, paths):
+        """讀取先前的種群檔，依名稱對應到目前數據的球員編號並修復，回傳不重複的球隊（依原本的 fitness 排序）"""
+        teams, missing = remap_rosters(load_rosters(paths), self.player_index)
+        unique = {}
+        for team in teams:
+            team = self.repair_roster(team)
+            unique.setdefault(tuple(team), team)
+        print(f"♨️ Warm start: {len(unique)} teams from {len(paths)} file(s), {missing} players not found in the new data")
+        return list(unique.values())
+
+    def repair_roster(self, team):
+        """
+        修復從其他數據對應過來的球隊：找不到的球員（-1）、重複的球員與不再符合位置資格的球員，
+        都換成該位置得分最高且尚未入選的球員；沒有候選人時保留空位（-1），後面的位置不會錯位。
+        """
+        seen = set()
+        repaired = []
+        for slot, position in enumerate(self.roster_slots):
+            player_id = team[slot] if slot < len(team) else -1
+            if player_id < 0 or player_id in seen or not self.eligibility.is_eligible(player_id, position):
+                player_id = self.eligibility.best_available(position, seen)
+                if player_id is None:
+                    repaired.append(EMPTY)
+                    continue
+            repaired.append(player_id)
+            seen.add(player_id)
+        return repaired
+
+    def initialize_chaos_population(self, size=None):
+        population = []
+        size = self.population_size if size is None else size
+
+        # 建立每個位置的小型候選池（30人）
+        candidate_pools = {}
+        for pos in self.roster_slots:
+            candidates = self.eligibility.top(pos, 30)  # 依 PTS 預先排序的候選名單
+            if self.config['shuffle_pools']:
+                random.shuffle(candidates)  # 打散前30名的順序
+            candidate_pools[pos] = candidates
+
+        # 初始化 Logistic Map 的 x
+        x = random.random()
+
+        for _ in range(size):  # 種群大小
+            team = []
+            selected_players = set()
+
+            for pos in self.roster_slots:
+                pool = candidate_pools[pos]
+                if not pool:
+                    # 沒有符合資格的球員（例如沒有傷兵可放 IL）時保留空位
+                    team.append(EMPTY)
+                    continue
+
+                # 使用 Logistic Map 產生選人亂數
+                x = logistic_map(x)
+                pick_index = int(x * len(pool))
+                if pick_index >= len(pool):
+                    pick_index = len(pool) - 1  # 超界就取最後一個
+
+                player_id = pool[pick_index]
+
+                # 避免選到重複球員
+                attempt = 0
+                while player_id in selected_players and attempt < len(pool):
+                    x = logistic_map(x)
+                    pick_index = int(x * len(pool))
+                    if pick_index >= len(pool):
+                        pick_index = len(pool) - 1
+                    player_id = pool[pick_index]
+                    attempt += 1
+
+                team.append(player_id)
+                selected_players.add(player_id)
+
+            population.append(team)
+
+        return population
+
+    def initialize_random_population(self, size=None):
+        population = []
+        size = self.population_size if size is None else size
+        for _ in range(size):  # 種群大小
+            team = []
+            selected_players = set()
+            # 預設只填入前 10 個先發位置；完整名單另外填入 Util、板凳與傷兵名單
+            for position in self.roster_slots:
+                # 優先選擇得分能力排名前 50% 的球員
+                candidates_pts = self.eligibility.top(position, 30, by='PTS')
+                candidates_ast = self.eligibility.top(position, 30, by='AST')
+                candidates_reb = self.eligibility.top(position, 30, by='ORB')
+                # 合併多個特性候選人列表，避免重複
+                candidates = list(set(candidates_pts + candidates_ast + candidates_reb))
+                candidates = [player for player in candidates if player not in selected_players]
+                if candidates:
+                    chosen_player = random.choice(candidates)
+                    team.append(chosen_player)
+                    selected_players.add(chosen_player)
+                else:
+                    # 沒有可選的球員時保留空位，後面的位置不會錯位
+                    team.append(EMPTY)
+            population.append(team)
+        return population
+
+    # 交叉操作
+    def crossover_population(self, parents1, parents2):
+        """
+        所有配對一次交叉（parents1[i] 與 parents2[i] 配對），並修復子代中的重複球員。
+        回傳 (子代 1 的 list, 子代 2 的 list)。
+        """
+        width = max(max(map(len, parents1), default=0), max(map(len, parents2), default=0))
+        matrix1, _ = team_matrix(parents1, width)
+        matrix2, _ = team_matrix(parents2, width)
+        children1, children2 = crossover_matrix(matrix1, matrix2, self.crossover_method)
+
+        # 移除子代中的重複球員
+        with self.profiler.phase('repair_duplicates'):
+            return self.repair_population(children1), self.repair_population(children2)
+
+    def crossover(self, parent1, parent2):
+        children1, children2 = self.crossover_population([parent1], [parent2])
+        return children1[0], children2[0]
+
+    def repair_population(self, matrix):
+        """
+        以排序後比較相鄰元素找出有重複球員的列，只有這些列需要逐格修復。
+        回傳 list of list（長度不同的親代交叉後尾端補齊用的空格會被移除；
+        球隊中間的空位保留在原本的欄位，後面的位置不會錯位）。
+        """
+        teams = matrix.tolist()
+        if (matrix[:, -1:] == EMPTY).any():
+            for team in teams:
+                while team and team[-1] == EMPTY:
+                    team.pop()
+        for row in np.flatnonzero(duplicate_rows(matrix)).tolist():
+            teams[row] = self.repair_duplicates(teams[row])
+        return teams
+
+    def repair_duplicates(self, team):
+        seen = set()
+        new_team = []
+        for position, player_id in zip(self.positions_required, team):
+            if player_id not in seen:
+                new_team.append(player_id)
+                seen.add(player_id)
+            else:
+                # 替換為得分最高、符合位置需求且尚未入選的候選球員
+                replacement = self.eligibility.best_available(position, seen)
+                if replacement is None:
+                    replacement = EMPTY  # 保留空位，後面的位置不會錯位
+                new_team.append(replacement)
+                seen.add(replacement)
+        return new_team
+
+    def lowest_scoring_slots(self, matrix):
+        """
+        每支球隊（(P x 位置數) 矩陣的每一列）基本分數最低的位置；找不到任何球員的列為 -1。
+        上季版本（top_pts）的分數不含個人犯規。
+        """
+        known = self.score_table.contains(matrix)
+        safe_ids = np.where(known, matrix, 0)
+        scores = self.score_table.base_score[safe_ids]
+        if self.local_search_strategy == 'top_pts':
+            scores = scores - self.score_table.stats['PF'][safe_ids] * self.scoring_system['PF']
+        lowest = np.argmin(np.where(known, scores, np.inf), axis=1)
+        return np.where(known.any(axis=1), lowest, -1)
+
+    def lowest_scoring_slot(self, team):
+        """找到球隊中基本分數最低的位置；找不到任何球員時回傳 -1"""
+        return int(self.lowest_scoring_slots(np.atleast_2d(np.asarray(team, dtype=np.int64)))[0])
+
+    def local_search_targets(self):
+        """
+        top_pts / top15_fitness 在每個位置換上的球員（只取決於位置，與球隊無關）；沒有候選人的位置為 -1。
+        """
+        strategy = self.local_search_strategy
+        if self._local_search_targets is None or self._local_search_targets[0] != strategy:
+            targets = []
+            for position in self.positions_required:
+                if strategy == 'top_pts':
+                    # 該位置得分最高的球員
+                    candidates = self.eligibility.candidates(position)
+                    targets.append(int(candidates[0]) if len(candidates) else EMPTY)
+                else:
+                    # 該位置PTS前15名球員（Pos 代號需完全吻合）中Fitness最高的人
+                    all_candidates = self.eligibility.top(position, 15, exact=True)
+                    fitness_scores = self.score_table.base_score[all_candidates]
+                    targets.append(all_candidates[int(np.argmax(fitness_scores))] if all_candidates else EMPTY)
+            self._local_search_targets = (strategy, np.array(targets, dtype=np.int64))
+        return self._local_search_targets[1]
+
+    def local_search(self, team):
+        if self.local_search_strategy == 'best_improvement':
+            # 套用進步最多的交換直到局部最佳（或用完步數）
+            return self.swap_search.improve(team, self.local_search_moves)[0]
+
+        # 替換分數最低的球員
+        lowest_score_index = self.lowest_scoring_slot(team)
+        if lowest_score_index != -1:
+            replacement = int(self.local_search_targets()[lowest_score_index])
+            if replacement != EMPTY:
+                team[lowest_score_index] = replacement
+
+        return team
+
+    def local_search_population(self, teams):
+        """
+        整批子代的局部搜尋，回傳 list of list（與 local_search 逐隊執行的結果相同）。
+        top_pts / top15_fitness 只是把每隊分數最低的位置換成該位置固定的球員，整批以陣列完成；
+        best_improvement 逐隊搜尋，搜尋中才以 ScoredTeam 只更新被交換的位置。
+        """
+        if self.local_search_strategy == 'best_improvement':
+            before = self.swap_search.evaluations
+            teams = [self.swap_search.improve(team, self.local_search_moves)[0] for team in teams]
+            evaluations = self.swap_search.evaluations - before
+            self.evaluations += evaluations
+            self.profiler.count('local_search', evaluations)
+            return teams
+        matrix, lengths = team_matrix(teams)
+        lowest = self.lowest_scoring_slots(matrix)
+        rows = np.flatnonzero(lowest >= 0)
+        slots = lowest[rows]
+        replacements = self.local_search_targets()[slots]
+        replaced = replacements != EMPTY
+        matrix[rows[replaced], slots[replaced]] = replacements[replaced]
+        return matrix_teams(matrix, lengths)
+
+    # 突變操作
+    def mutate_population(self, teams, mutation_rate=0.2):
+        """
+        整批球隊一次突變，回傳新的 list of list（不修改傳入的球隊）。
+        每個位置以 mutation_rate 的機率換成符合該位置、且不在隊中的隨機球員。
+        """
+        matrix, lengths = team_matrix(teams)
+        mutate_matrix(matrix, lengths, self.slot_pools, mutation_rate, self.eligibility)
+        return matrix_teams(matrix, lengths)
+
+    def mutate(self, team, mutation_rate=0.2):
+        """單一球隊的突變（直接修改 team；ScoredTeam 只更新被替換的位置）"""
+        for i, player_id in enumerate(self.mutate_population([team], mutation_rate)[0]):
+            if team[i] != player_id:
+                team[i] = player_id
+        return team
+
+    def mutate_elite(self, elite, mutation_rate=0.1):
+        """
+        對精英個體進行小幅變異
+        """
+        chosen = np.flatnonzero(np.random.random_sample(len(elite)) < mutation_rate).tolist()
+        new_elite = list(elite)
+        if chosen:
+            # 對精英個體進行突變
+            for index, team in zip(chosen, self.mutate_population([elite[i] for i in chosen], mutation_rate=0.1)):
+                new_elite[index] = team
+        return new_elite
+
+    # 演化一個世代
+    def evolve_population(self, population, generation):
+        """
+        對種群演化一個世代，回傳 (下一代種群, 當代最佳球隊, 當代最佳 fitness, 是否找到目標球隊)。
+        genetic_algorithm 與島嶼模式共用此函式。
+        """
+        profiler = self.profiler
+
+        # 整個種群一次計算 fitness（快取沒命中的球隊以向量化批次計算）
+        with profiler.phase('fitness'):
+            fitness_array = self.team_memo.evaluate_population(population)
+            fitness_scores = fitness_array.tolist()
+        profiler.count('fitness', len(population))
+
+        # 保留精英
+        with profiler.phase('elitism'):
+            elite_count = max(2, int(len(population) * 0.1))  # 保留 10% 精英
+            elite_indices = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i], reverse=True)[:elite_count]
+            elites = [population[i] for i in elite_indices]  # 保留精英個體
+            elites = self.mutate_elite(elites)  # 對精英進行小幅變異
+
+        # 計算多樣性（平均值與標準差交給 telemetry 記錄）
+        with profiler.phase('statistics'):
+            diversity = np.std(fitness_scores)
+            self.population_stats = (float(np.mean(fitness_scores)), float(diversity))
+
+        # 重新初始化部分種群（避免早熟收斂）
+        if diversity < 1e-3:  # 如果多樣性過低
+            with profiler.phase('initialize_population'):
+                for i in range(len(population) // 10):  # 替換 10% 種群
+                    population[i] = self.initialize_population()[0]
+
+        # 當前世代最佳解
+        best_index = fitness_scores.index(max(fitness_scores))
+        best_team = population[best_index]
+        best_fitness = fitness_scores[best_index]
+
+        # 提前停止條件：檢查是否滿足目標球員組合
+        with profiler.phase('target_check'):
+            target_found = self.target_players.issubset(self.team_names(best_team))
+        if target_found:
+            print(f"Target team found at generation {generation + 1} with fitness {best_fitness}. Stopping early.")
+            return population, best_team, best_fitness, True  # 提前結束循環
+
+        # 選擇下一代
+        next_generation = elites.copy()
+        num_pairs = (len(population) - elite_count) // 2
+        # 所有親代一次抽出（累積分布每個世代只建立一次）
+        with profiler.phase('selection'):
+            parent_indices = select_parents(
+                fitness_array, 2 * num_pairs, self.selection, tournament_size=self.tournament_size
+            ).tolist()
+        with profiler.phase('crossover'):
+            parents = [population[index] for index in parent_indices]
+            children1, children2 = self.crossover_population(parents[0::2], parents[1::2])
+            # 與 parents 相同的順序：每個配對的子代 1、子代 2
+            children = [child for pair in zip(children1, children2) for child in pair]
+        # 所有子代一次突變
+        with profiler.phase('mutate'):
+            children = self.mutate_population(children)
+        # 子代保持一般的整數 list，整批局部搜尋
+        with profiler.phase('local_search'):
+            children = self.local_search_population(children)
+
+        # 檢查子代是否優於父代（子代以一次向量化批次計算，父代由快取取得）
+        with profiler.phase('fitness'):
+            child_scores = self.score_table.evaluate_population(children)[0]
+            self.evaluations += len(children)
+            parent_scores = self.team_memo.evaluate_population(parents)
+        profiler.count('fitness', len(children) + len(parents))
+        with profiler.phase('replacement'):
+            for child, child_score, parent, parent_score in zip(children, child_scores, parents, parent_scores):
+                # 添加到下一代
+                next_generation.append(parent if child_score < parent_score else child)
+
+        return next_generation, best_team, best_fitness, False
+
+    def checkpoint_fingerprint(self):
+        """會影響演化結果的設定與數據（世代數除外，接續時可以延長）"""
+        return {
+            'season': self.season, 'init': self.init, 'population_size': self.population_size,
+            'selection': self.selection, 'tournament_size': self.tournament_size,
+            'crossover_method': self.crossover_method, 'local_search': self.local_search_strategy,
+            'local_search_moves': self.local_search_moves, 'players': data_fingerprint(self.player_index),
+            'roster_size': self.roster_size, 'slot_weights': self.slot_weights,
+        }
+
+    def write_checkpoint(self, path, population, generation, history, best_team, best_fitness, elapsed):
+        save_checkpoint(
+            path, population, generation, history, best_team, best_fitness, self.checkpoint_fingerprint(),
+            extra={
+                'memo': {'hits': self.team_memo.hits, 'misses': self.team_memo.misses},
+                'stopping': self.stopping.state(),
+                'elapsed': elapsed,
+            }
+        )
+
+    def restore_checkpoint(self, path):
+        """讀取檢查點（同時還原亂數狀態、快取統計與提前停止規則），回傳狀態字典"""
+        state = load_checkpoint(path, self.checkpoint_fingerprint())
+        self.team_memo.hits = state['extra']['memo']['hits']
+        self.team_memo.misses = state['extra']['memo']['misses']
+        self.stopping.restore(state['extra']['stopping'])
+        print(f"⏯️ Resuming from {path} at generation {state['generation'] + 1}")
+        return state
+
+    # 遺傳算法主流程
+    def genetic_algorithm(self):
+        start_time = time.time()  # ⏱️ 開始計時
+        self.team_memo.clear()  # 每一輪從空的快取開始
+        self.profiler.reset()
+        self.stopping.start()
+        checkpoint_path = run_output_path(self.checkpoint_file) if self.checkpoint_file is not None else None
+        if self.resume and checkpoint_path is not None and checkpoint_path.exists():
+            state = self.restore_checkpoint(checkpoint_path)
+            population = state['population']
+            best_fitness_history = state['history']
+            best_team, best_fitness = state['best_team'], state['best_fitness']
+            first_generation = state['generation']
+            start_time -= state['extra']['elapsed']  # 總時間包含中斷前的部分
+        else:
+            with self.profiler.phase('initialize_population'):
+                population = self.initial_population()
+            best_fitness_history = []
+            first_generation = 0
+        self.telemetry.start_run(self.team_memo.stats(), self.evaluations)
+
+        generation = first_generation - 1
+        for generation in range(first_generation, self.generations):
+            generation_start = time.perf_counter()
+            population, best_team, best_fitness, target_found = self.evolve_population(population, generation)
+            best_fitness_history.append(best_fitness)
+            stop_reason = self.stopping.update(best_fitness)
+            mean, diversity = self.population_stats
+            self.telemetry.generation(
+                generation, best_fitness, mean, diversity, self.team_memo.stats(),
+                time.perf_counter() - generation_start,
+                final=target_found or stop_reason is not None or generation == self.generations - 1,
+                evaluations=self.evaluations
+            )
+            if target_found:
+                break  # 提前結束循環
+            if stop_reason is not None:
+                print(f"Stopping early at generation {generation + 1}: {stop_reason}.")
+                break
+            if checkpoint_path is not None and (generation + 1) % self.checkpoint_every == 0:
+                self.write_checkpoint(
+                    checkpoint_path, population, generation + 1, best_fitness_history, best_team, best_fitness,
+                    time.time() - start_time
+                )
+        end_time = time.time()  # ⏱️ 結束計時
+        total_time = end_time - start_time
+
+        # 只在最後印出最佳球隊的明細
+        self.print_best(best_team, best_fitness, total_time)
+        if self.population_file is not None:
+            self.save_population(run_output_path(self.population_file), population)
+        memo_stats = self.team_memo.stats()
+        print(f"🗂️ Team memo: {memo_stats['hits']} hits, {memo_stats['misses']} misses ({memo_stats['hit_rate']:.1%} hit rate)")
+        if self.profiler.enabled:
+            print(f"⏱️ Time by phase ({generation + 1} generations):")
+            print(self.profiler.format_breakdown())
+
+        return best_team, best_fitness, total_time, generation + 1, best_fitness_history
+
+    def print_best(self, best_team, best_fitness, total_time):
+        print(f"Best Fitness = {best_fitness}")
+        for player, score, position, injury_impact, no_injury_score in self.fitness_function(best_team)[1]:
+            print(f"  {player} ({position}): Adjusted Score = {score:.2f}, No Injury Score = {no_injury_score:.2f}, Games Played Ratio = {injury_impact:.2%}")
+        print(f"⏱️ Total execution time: {total_time:.2f} seconds")
+
+    def save_population(self, path, population):
+        """以球員名稱儲存種群（供下一份數據暖啟動）"""
+        save_population(path, population, self.score_table.evaluate_population(population)[0].tolist(),
+                        self.player_index, self.season)
+        print(f"💾 Population saved to {path}")
+
+    def starting_team(self):
+        """軌跡式引擎的起點：初始種群中 fitness 最高、並修復過重複球員的球隊"""
+        population = self.initial_population()
+        scores = self.score_table.evaluate_population(population)[0]
+        return self.repair_duplicates(population[int(np.argmax(scores))])
+
+    def run_trajectory(self, search, **options):
+        """執行軌跡式引擎，回傳值與 genetic_algorithm 相同（世代數為實際步數）"""
+        start_time = time.time()  # ⏱️ 開始計時
+        self.stopping.start()
+        team = self.starting_team()
+        moves = SwapMoves(self.score_table, self.slot_pools, len(team))
+        best_team, best_fitness, history, steps = search(
+            self.score_table, moves, team, stopping=self.stopping, **options
+        )
+        total_time = time.time() - start_time
+        if self.stopping.reason is not None:
+            print(f"Stopping early at step {steps}: {self.stopping.reason}.")
+        self.print_best(best_team, best_fitness, total_time)
+        return best_team, best_fitness, total_time, steps, history
+
+    # 模擬退火
+    def simulated_annealing(self, iterations=20000, start_temperature=10.0, final_temperature=0.01):
+        return self.run_trajectory(
+            simulated_annealing, iterations=iterations, start_temperature=start_temperature,
+            final_temperature=final_temperature
+        )
+
+    # 禁忌搜尋（含 aspiration 條件）
+    def tabu_search(self, iterations=500, tenure=7):
+        return self.run_trajectory(tabu_search, iterations=iterations, tenure=tenure, num_players=len(self.player_index))
+
+    def optimize(self, engine='ga', **options):
+        """
+        以指定引擎最佳化球隊，options 傳給該引擎（例如 island 的 num_islands、sa 的 iterations）。
+        所有引擎的回傳值相同：(最佳球隊, 最佳 fitness, 執行時間, 世代數或步數, 收斂紀錄)。
+        """
+        engines = {
+            'ga': self.genetic_algorithm,
+            'island': self.island_genetic_algorithm,
+            'exact': self.exact_solution,
+            'sa': self.simulated_annealing,
+            'tabu': self.tabu_search,
+        }
+        if engine not in engines:
+            raise ValueError(f"Unknown engine: {engine}")
+        return engines[engine](**options)
+
+    # 島嶼模式：多個子種群在不同行程中演化，並定期遷移最佳個體
+    def island_genetic_algorithm(self, num_islands=4, migration_interval=10, migration_size=2, topology='ring'):
+        """
+        島嶼模式：population_size 平均分給 num_islands 個子種群（每個島嶼 population_size // num_islands 支球隊），
+        總個體數與單一種群的 GA 相同，速度與結果可以直接比較。
+        """
+        island_size = self.population_size // num_islands if num_islands >= 1 else 0
+        if island_size < 2:
+            raise ValueError("population_size must give every island at least 2 teams")
+        # 各島嶼在子行程中演化，沒有逐代的 telemetry、檢查點與最後的種群可以寫出
+        unsupported = [
+            name for name, value in (
+                ('telemetry', self.telemetry.path), ('checkpoint_file', self.checkpoint_file),
+                ('resume', self.resume), ('population_file', self.population_file),
+            ) if value
+        ]
+        if unsupported:
+            raise ValueError(f"The island engine does not support: {', '.join(unsupported)}")
+        return run_islands(
+            partial(self.initial_population, island_size), self.evolve_population,
+            self.score_table.evaluate_population,
+            generations=self.generations, num_islands=num_islands, migration_interval=migration_interval,
+            migration_size=migration_size, topology=topology, stopping=self.stopping
+        )
+
+    # 精確解：以指派問題直接求出 fitness_function 的最佳球隊
+    def exact_solution(self):
+        return exact_algorithm(self.score_table, self.roster_size)
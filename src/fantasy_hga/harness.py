@@ -0,0 +1,94 @@
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+
+def run_seeds(num_runs, seed=None):
+    """
+    由一個主種子衍生出每一輪各自的種子。
+    seed 為 None 時使用系統亂數，但每一輪實際使用的種子都會記錄在結果中，可事後重現。
+    """
+    sequence = np.random.SeedSequence(seed)
+    return [int(child.generate_state(1, dtype=np.uint32)[0]) for child in sequence.spawn(num_runs)]
+
+
+def seed_everything(seed):
+    """同時設定 random 與 NumPy 的全域亂數種子"""
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+# 目前這個行程正在執行的輪次（run_once 設定，供 telemetry 標記紀錄）
+_current_run = {'run': None, 'seed': None}
+
+
+def current_run():
+    """回傳目前執行中的 {'run': 輪次, 'seed': 種子}；不在 run_once 中時皆為 None"""
+    return dict(_current_run)
+
+
+def run_output_path(path, run=None):
+    """
+    每一輪各自的輸出檔：profile.pstats -> profile.run0.pstats。
+    run 預設為目前執行中的輪次；不在 run_once 中時回傳原本的路徑。
+    """
+    if run is None:
+        run = _current_run['run']
+    path = Path(path)
+    if run is None:
+        return path
+    return path.with_name(f"{path.stem}.run{run}{path.suffix}")
+
+
+def run_once(run_function, run_index, seed):
+    """
+    以指定種子執行一輪實驗，回傳結果字典。
+    run_function 需回傳 (best_team, best_fitness, total_time, generations, best_fitness_history)。
+    """
+    _current_run.update(run=run_index, seed=seed)
+    seed_everything(seed)
+    start_time = time.time()
+    best_team, best_fitness, exec_time, generations, best_fitness_history = run_function()
+    return {
+        'run': run_index,
+        'seed': seed,
+        'best_team': [int(player_id) for player_id in best_team],
+        'best_fitness': float(best_fitness),
+        'generations': int(generations),
+        'time': float(exec_time),
+        'wall_time': time.time() - start_time,
+        'history': [float(fitness) for fitness in best_fitness_history],
+    }
+
+
+def process_context():
+    # 腳本的函式定義在 __main__ 中，用 fork 讓子行程直接沿用已載入的資料與函式
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def run_experiments(run_function, num_runs=5, seed=None, max_workers=None):
+    """
+    以 ProcessPoolExecutor 平行執行 num_runs 輪獨立實驗。
+    每一輪使用由 seed 衍生的固定種子，結果依輪次排序，與 worker 數量無關。
+    max_workers=1 時直接在目前的行程中依序執行。
+    """
+    seeds = run_seeds(num_runs, seed)
+    if max_workers is None:
+        max_workers = min(num_runs, os.cpu_count() or 1)
+
+    if max_workers <= 1:
+        return [run_once(run_function, run_index, run_seed) for run_index, run_seed in enumerate(seeds)]
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=process_context()) as executor:
+        futures = [
+            executor.submit(run_once, run_function, run_index, run_seed)
+            for run_index, run_seed in enumerate(seeds)
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,101 @@
+from bisect import insort
+
+
+class ScoredTeam(list):
+    """
+    帶有增量 fitness 的球隊（list 子類別）。
+    保存每個位置的分數與位置懲罰，替換單一位置時只重算受影響的位置，
+    因此突變與局部搜尋後不必再從頭計算整隊的 fitness。
+    計分規則與 ScoreTable.score_team 相同：重複球員只計第一次出現的位置。
+    """
+
+    def __init__(self, score_table, team=()):
+        super().__init__(team)
+        self.score_table = score_table
+        self._rescore()
+
+    def __reduce__(self):
+        # 傳到其他行程時只送出球員編號，不連同分數表一起序列化
+        return list, (list(self),)
+
+    @property
+    def fitness(self):
+        return self.total_score - self.penalty
+
+    def _rescore(self):
+        """從頭計算所有位置（建立時或整段修改後使用）"""
+        self.slot_scores = [0.0] * len(self)
+        self.slot_penalties = [0] * len(self)
+        self.total_score = 0.0
+        self.penalty = 0
+        self.player_slots = {}
+        for slot, player_id in enumerate(self):
+            self.player_slots.setdefault(player_id, []).append(slot)
+        for slots in self.player_slots.values():
+            self._refresh(slots[0])
+
+    def _refresh(self, slot):
+        """重新計算單一位置的分數與懲罰，並把差值加到總分"""
+        table = self.score_table
+        player_id = list.__getitem__(self, slot)
+        score = 0.0
+        penalty = 0
+        if (self.player_slots[player_id][0] == slot and 0 <= player_id < table.size
+                and table.valid[player_id]):
+            score = table.slot_value[slot, player_id]
+            if not table.slot_match[slot, player_id]:
+                penalty = table.position_penalty
+        self.total_score += score - self.slot_scores[slot]
+        self.penalty += penalty - self.slot_penalties[slot]
+        self.slot_scores[slot] = score
+        self.slot_penalties[slot] = penalty
+
+    def replace(self, slot, player_id):
+        """把 slot 換成 player_id，只更新被替換的位置以及同一球員的其他位置"""
+        old_player = list.__getitem__(self, slot)
+        if old_player == player_id:
+            return
+        list.__setitem__(self, slot, player_id)
+
+        # 原本的球員離開此位置：若它是第一次出現，下一個相同球員的位置改為計分
+        old_slots = self.player_slots[old_player]
+        was_first = old_slots[0] == slot
+        old_slots.remove(slot)
+        if not old_slots:
+            del self.player_slots[old_player]
+        elif was_first:
+            self._refresh(old_slots[0])
+
+        # 新球員加入此位置：若變成第一次出現，原本計分的位置改為不計分
+        new_slots = self.player_slots.setdefault(player_id, [])
+        insort(new_slots, slot)
+        if new_slots[0] == slot and len(new_slots) > 1:
+            self._refresh(new_slots[1])
+        self._refresh(slot)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            list.__setitem__(self, index, value)
+            self._rescore()
+        else:
+            self.replace(range(len(self))[index], value)
+
+    # 其他會改變長度或順序的操作較少見，直接整隊重算
+    def _rescoring(method):
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self._rescore()
+            return result
+        return wrapper
+
+    __delitem__ = _rescoring(list.__delitem__)
+    __iadd__ = _rescoring(list.__iadd__)
+    append = _rescoring(list.append)
+    extend = _rescoring(list.extend)
+    insert = _rescoring(list.insert)
+    pop = _rescoring(list.pop)
+    remove = _rescoring(list.remove)
+    clear = _rescoring(list.clear)
+    sort = _rescoring(list.sort)
+    reverse = _rescoring(list.reverse)
+    del _rescoring
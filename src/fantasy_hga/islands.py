@@ -0,0 +1,140 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .harness import process_context, seed_everything
+
+# 遷移拓撲：ring = 只傳給下一個島嶼，all = 傳給其他所有島嶼
+TOPOLOGIES = ('ring', 'all')
+
+
+def evolve_island(initialize_function, evolve_function, population, start_generation, generations, seed):
+    """
+    在單一島嶼上演化 generations 個世代（於子行程中執行）。
+    population 為 None 時先以 initialize_function 建立初始種群。
+    """
+    seed_everything(seed)
+    if population is None:
+        population = initialize_function()
+
+    history = []
+    best_team = None
+    best_fitness = float('-inf')
+    target_found = False
+    for generation in range(start_generation, start_generation + generations):
+        population, team, fitness, target_found = evolve_function(population, generation)
+        history.append(fitness)
+        if fitness > best_fitness:
+            best_team, best_fitness = list(team), fitness
+        if target_found:
+            break
+    return population, history, best_team, best_fitness, target_found
+
+
+def migration_sources(island, num_islands, topology):
+    """回傳會把最佳個體送到 island 的島嶼編號"""
+    if topology == 'ring':
+        return [(island - 1) % num_islands]
+    return [other for other in range(num_islands) if other != island]
+
+
+def migrate(populations, evaluate_function, migration_size=2, topology='ring'):
+    """
+    各島嶼把最佳的 migration_size 個個體送到相鄰島嶼，取代對方最差的個體。
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown migration topology: {topology}")
+    if len(populations) < 2 or migration_size <= 0:
+        return populations
+
+    scores = [evaluate_function(population)[0] for population in populations]
+    emigrants = [
+        [list(population[i]) for i in np.argsort(-island_scores, kind='stable')[:migration_size]]
+        for population, island_scores in zip(populations, scores)
+    ]
+    for island, population in enumerate(populations):
+        incoming = [
+            team
+            for source in migration_sources(island, len(populations), topology)
+            for team in emigrants[source]
+        ]
+        worst = np.argsort(scores[island], kind='stable')[:len(incoming)]
+        for slot, team in zip(worst, incoming):
+            population[slot] = list(team)
+    return populations
+
+
+def run_islands(initialize_function, evolve_function, evaluate_function, generations, num_islands=4,
+                migration_interval=10, migration_size=2, topology='ring', seed=None, max_workers=None,
+                stopping=None):
+    """
+    島嶼模式的遺傳算法：num_islands 個子種群在不同行程中演化，
+    每 migration_interval 個世代依 topology 交換一次最佳個體。
+    回傳值與 genetic_algorithm 相同：(最佳球隊, 最佳 fitness, 執行時間, 世代數, 每代最佳 fitness)。
+    各島嶼每個階段的種子由 seed 衍生，結果與 worker 數量無關。
+    stopping（EarlyStopping）依各世代所有島嶼的最佳 fitness 更新；島嶼在子行程中一次演化到下一次遷移，
+    因此停止規則在每次遷移時才生效。
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown migration topology: {topology}")
+    start_time = time.time()  # ⏱️ 開始計時
+    if stopping is not None:
+        stopping.start()
+    if seed is None:
+        seed = random.getrandbits(32)
+    seed_sequence = np.random.SeedSequence(seed)
+    if max_workers is None:
+        max_workers = num_islands
+
+    populations = [None] * num_islands
+    best_team = None
+    best_fitness = float('-inf')
+    best_fitness_history = []
+    generation = 0
+
+    executor = None
+    if max_workers > 1:
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=process_context())
+    try:
+        while generation < generations:
+            span = min(migration_interval, generations - generation)
+            seeds = [int(child.generate_state(1, dtype=np.uint32)[0]) for child in seed_sequence.spawn(num_islands)]
+            jobs = [
+                (initialize_function, evolve_function, populations[island], generation, span, seeds[island])
+                for island in range(num_islands)
+            ]
+            if executor is None:
+                results = [evolve_island(*job) for job in jobs]
+            else:
+                results = [future.result() for future in [executor.submit(evolve_island, *job) for job in jobs]]
+
+            populations = [result[0] for result in results]
+            histories = [result[1] for result in results]
+            completed = max(len(history) for history in histories)
+            stop_reason = None
+            for offset in range(completed):
+                best_fitness_history.append(max(history[offset] for history in histories if len(history) > offset))
+                if stopping is not None and stop_reason is None:
+                    stop_reason = stopping.update(max(best_fitness_history))
+            generation += completed
+
+            for _, _, team, fitness, _ in results:
+                if team is not None and fitness > best_fitness:
+                    best_team, best_fitness = team, fitness
+
+            if any(result[4] for result in results):
+                break  # 任一島嶼找到目標球隊就提前結束
+            if stop_reason is not None:
+                print(f"Stopping early at generation {generation}: {stop_reason}.")
+                break
+            if generation < generations:
+                populations = migrate(populations, evaluate_function, migration_size, topology)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    total_time = time.time() - start_time
+    print(f"⏱️ Total execution time: {total_time:.2f} seconds")
+    return best_team, best_fitness, total_time, generation, best_fitness_history
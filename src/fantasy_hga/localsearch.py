@@ -0,0 +1,71 @@
+from .incremental import ScoredTeam
+
+# 局部搜尋方式：top_pts = 最低分位置換成該位置 PTS 最高者（上季）、top15_fitness = 換成 PTS 前 15 名中分數最高者，
+# best_improvement = 在所有 (位置, 候選球員) 交換中選擇進步最多的一步，重複直到局部最佳或用完步數
+LOCAL_SEARCHES = ('top_pts', 'top15_fitness', 'best_improvement')
+
+
+class OneSwapSearch:
+    """
+    單一交換鄰域的 best-improvement 局部搜尋。
+    每個位置的候選球員（符合位置資格、存在於分數表）依「放在這個位置的價值」
+    （該格的價值，不符合位置時扣位置懲罰）預先排序一次；某個位置最好的交換就是名單中第一位不在隊中的球員，
+    最多略過隊中的球員數，因此每一步的成本只與球隊大小有關，與球員池大小無關。
+    evaluations 累計評估過的次數（每個比較過的交換與每支球隊的初始計分各算一次）。
+    """
+
+    def __init__(self, score_table, eligibility, positions):
+        self.score_table = score_table
+        self.evaluations = 0
+        self.ranked = []
+        self.values = []
+        for slot, position in enumerate(positions):
+            candidates = eligibility.candidates(position)
+            candidates = candidates[score_table.contains(candidates)]
+            values = score_table.slot_value[slot, candidates] - \
+                score_table.position_penalty * ~score_table.slot_match[slot, candidates]
+            order = (-values).argsort(kind='stable')
+            self.ranked.append(candidates[order].tolist())
+            self.values.append(values[order].tolist())
+
+    def best_move(self, team, min_gain=1e-9):
+        """
+        回傳進步最多的交換 (增加的 fitness, 位置, 新球員)；沒有能進步超過 min_gain 的交換時回傳 None。
+        team 為 ScoredTeam，目前每個位置的貢獻直接取自增量分數。
+        """
+        members = set(team)
+        best = None
+        best_gain = min_gain
+        evaluated = 0
+        for slot in range(min(len(team), len(self.ranked))):
+            current = team.slot_scores[slot] - team.slot_penalties[slot]
+            for player_id, value in zip(self.ranked[slot], self.values[slot]):
+                if player_id not in members:
+                    evaluated += 1
+                    if value - current > best_gain:
+                        best, best_gain = (slot, player_id), value - current
+                    break
+        self.evaluations += evaluated
+        return None if best is None else (best_gain, *best)
+
+    def improve(self, team, max_moves=10):
+        """
+        反覆套用最好的交換，直到沒有能進步的交換或用完 max_moves 步，回傳 (球隊, 實際步數)。
+        team 為 ScoredTeam 時直接修改；一般 list 也會就地更新。
+        """
+        if isinstance(team, ScoredTeam):
+            scored = team
+        else:
+            scored = ScoredTeam(self.score_table, team)
+            self.evaluations += 1
+        moves = 0
+        while moves < max_moves:
+            move = self.best_move(scored)
+            if move is None:
+                break
+            _, slot, player_id = move
+            scored[slot] = player_id
+            moves += 1
+        if scored is not team:
+            team[:] = scored
+        return team, moves
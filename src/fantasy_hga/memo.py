@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class TeamMemo:
+    """
+    球隊層級的 fitness 快取（LRU）。
+    以「位置 -> 球員」的 tuple 作為 key，保存 fitness 與入選球員明細；
+    重複出現的球隊（精英、複製的父代）只需要一次 dict 查詢。
+    """
+
+    def __init__(self, score_table, max_size=200000):
+        self.score_table = score_table
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(team):
+        return tuple(team)
+
+    def _store(self, key, fitness):
+        # 明細在第一次需要時才建立
+        self.entries[key] = [fitness, None]
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def _get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def evaluate_population(self, population):
+        """
+        回傳整個種群的 fitness 陣列；沒命中的球隊一次批次計算後存入快取。
+        同一批中重複的球隊只計算一次：第一次出現算未命中，其餘算命中。
+        """
+        fitness = np.empty(len(population))
+        missing = []
+        missing_keys = {}
+        for row, team in enumerate(population):
+            key = self.key(team)
+            rows = missing_keys.get(key)
+            if rows is not None:
+                rows.append(row)
+                self.hits += 1
+                continue
+            entry = self._get(key)
+            if entry is not None:
+                fitness[row] = entry[0]
+            else:
+                missing_keys[key] = [row]
+                missing.append(team)
+
+        if missing:
+            scores = self.score_table.evaluate_population(missing)[0]
+            for (key, rows), score in zip(missing_keys.items(), scores):
+                fitness[rows] = score
+                self._store(key, float(score))
+        return fitness
+
+    def fitness_function(self, team):
+        """與原本的 fitness_function 相同，回傳 (fitness, 入選球員明細)"""
+        key = self.key(team)
+        entry = self._get(key)
+        if entry is None:
+            self._store(key, float(self.score_table.evaluate_population([team])[0][0]))
+            entry = self.entries[key]
+        if entry[1] is None:
+            _, _, selected_ids = self.score_table.score_team(team)
+            entry[1] = self.score_table.selected_players(selected_ids)
+        return entry[0], entry[1]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.entries),
+        }
@@ -0,0 +1,123 @@
+import numpy as np
+
+# 矩陣中沒有球員的格子（長度不足的球隊補齊用）
+EMPTY = -1
+
+# 交叉方式：one_point = 單點交叉（原本的做法）、two_point = 兩點交叉、uniform = 均勻交叉
+CROSSOVERS = ('one_point', 'two_point', 'uniform')
+
+
+def team_matrix(teams, width=None):
+    """
+    把一批球隊轉成 (球隊數, width) 的整數矩陣與每隊長度；長度不足的部分填 EMPTY。
+    """
+    lengths = np.fromiter((len(team) for team in teams), dtype=np.int64, count=len(teams))
+    if width is None:
+        width = int(lengths.max()) if len(teams) else 0
+    matrix = np.full((len(teams), width), EMPTY, dtype=np.int64)
+    if len(teams) and (lengths == width).all():
+        matrix[:] = teams
+    else:
+        for row, team in enumerate(teams):
+            matrix[row, :len(team)] = team
+    return matrix, lengths
+
+
+def matrix_teams(matrix, lengths):
+    """team_matrix 的反向轉換：回傳 list of list（去掉 EMPTY 補齊的部分）"""
+    rows = matrix.tolist()
+    width = matrix.shape[1]
+    return [row if length == width else row[:length] for row, length in zip(rows, lengths.tolist())]
+
+
+class SlotPools:
+    """
+    每個球隊位置（positions_required 的每一格）的候選球員，串接成一個陣列：
+    第 slot 格的候選人為 flat[offsets[slot]:offsets[slot] + sizes[slot]]。
+    可以用一次陣列索引替任意多個格子抽出候選人。
+    """
+
+    def __init__(self, eligibility, positions):
+        pools = [eligibility.candidates(position) for position in positions]
+        self.positions = list(positions)
+        self.sizes = np.array([len(pool) for pool in pools], dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(self.sizes)[:-1]]).astype(np.int64)
+        self.flat = np.concatenate(pools).astype(np.int64) if pools else np.empty(0, dtype=np.int64)
+
+    def sample(self, slots, rng=np.random):
+        """替 slots 中的每一格各抽一位候選人（該格沒有候選人時不可呼叫）"""
+        sizes = self.sizes[slots]
+        picks = (rng.random_sample(len(slots)) * sizes).astype(np.int64)
+        return self.flat[self.offsets[slots] + np.minimum(picks, sizes - 1)]
+
+
+def duplicate_rows(matrix):
+    """每一列（忽略 EMPTY）是否有重複球員：排序後比較相鄰元素"""
+    ordered = np.sort(matrix, axis=1)
+    repeated = (ordered[:, 1:] == ordered[:, :-1]) & (ordered[:, 1:] != EMPTY)
+    return repeated.any(axis=1)
+
+
+def mutate_matrix(matrix, lengths, slot_pools, mutation_rate, eligibility, rng=np.random):
+    """
+    整批子代一次突變：以一次亂數呼叫產生所有球員格子的突變遮罩，
+    被選中的格子從該位置的候選陣列抽出新球員（直接修改 matrix）。
+    新球員與隊中其他球員重複（或與原球員相同）的列很少，改為逐格以 random_candidate 重抽。
+    回傳被突變的 (列, 欄) 索引。
+    """
+    if matrix.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    width = matrix.shape[1]
+    mask = rng.random_sample(matrix.shape) < mutation_rate
+    mask &= np.arange(width) < lengths[:, None]
+    mask &= slot_pools.sizes[:width] > 0
+    rows, cols = np.nonzero(mask)
+    if len(rows) == 0:
+        return rows, cols
+
+    proposals = slot_pools.sample(cols, rng)
+    unchanged = proposals == matrix[rows, cols]
+    matrix[rows, cols] = proposals
+
+    conflicts = duplicate_rows(matrix)
+    conflicts[rows[unchanged]] = True
+    if conflicts.any():
+        # 重複的列：依序重抽這一列被突變的格子，排除隊中其他球員
+        same_player = set(zip(rows[unchanged].tolist(), cols[unchanged].tolist()))
+        for row in np.flatnonzero(conflicts).tolist():
+            team = matrix[row, :lengths[row]].tolist()
+            for col in cols[rows == row].tolist():
+                if (row, col) in same_player or team.count(team[col]) > 1:
+                    replacement = eligibility.random_candidate(slot_pools.positions[col], set(team))
+                    if replacement is not None:
+                        team[col] = replacement
+            matrix[row, :lengths[row]] = team
+    return rows, cols
+
+
+def crossover_mask(shape, method='one_point', rng=np.random):
+    """
+    交叉遮罩：True 的格子子代 1 取自親代 1、子代 2 取自親代 2，其餘互換。
+    one_point 的切點在 [1, width - 2]（避免在首尾交叉），two_point 交換 [a, b) 這一段（a 在 [1, width - 2]、b 在 (a, width]，可以包含最後一格）。
+    """
+    count, width = shape
+    columns = np.arange(width)
+    if method == 'one_point':
+        points = rng.randint(1, max(width - 1, 2), size=count)
+        return columns < points[:, None]
+    if method == 'two_point':
+        start = rng.randint(1, max(width - 1, 2), size=count)
+        end = start + 1 + (rng.random_sample(count) * np.maximum(width - start, 0)).astype(np.int64)
+        return ~((columns >= start[:, None]) & (columns < end[:, None]))
+    if method == 'uniform':
+        return rng.random_sample(shape) < 0.5
+    raise ValueError(f"Unknown crossover method: {method}")
+
+
+def crossover_matrix(parents1, parents2, method='one_point', rng=np.random):
+    """
+    所有配對一次交叉：parents1 / parents2 為 (配對數, width) 的球員編號矩陣，回傳 (子代 1, 子代 2)。
+    每一格都保留在原本的欄位，positions_required 的位置意義不變。
+    """
+    mask = crossover_mask(parents1.shape, method, rng)
+    return np.where(mask, parents1, parents2), np.where(mask, parents2, parents1)
@@ -0,0 +1,70 @@
+import numpy as np
+
+# 交易球員的合計列：上季為 TOT，本季為 2TM / 3TM
+AGGREGATE_TEAM_PATTERN = r'TOT|\d+TM'
+
+
+class PlayerIndex:
+    """
+    每位球員只保留一筆資料的標準球員索引。
+    球員以連續的整數編號（0..n-1）表示，Rk 與編號之間的轉換都是陣列索引。
+    同一位球員的所有列（合計列與各隊的列）都對應到同一個編號。
+    """
+
+    def __init__(self, players, rk_to_id):
+        self.players = players
+        self.size = len(players)
+        self.ids = players['id'].to_numpy()
+        self.rk = players['Rk'].to_numpy()
+        self.rk_to_id = rk_to_id
+        # 比對名單用的名稱（去除空白、小寫）
+        self.names = players['Player'].str.strip().str.lower().to_numpy(dtype=object)
+
+    def __len__(self):
+        return self.size
+
+    def ids_for_rk(self, rk):
+        """Rk 轉為球員編號；找不到的 Rk 回傳 -1"""
+        rk = np.asarray(rk, dtype=np.int64)
+        in_range = (rk >= 0) & (rk < len(self.rk_to_id))
+        return np.where(in_range, self.rk_to_id[np.where(in_range, rk, 0)], -1)
+
+    def rk_for_ids(self, ids):
+        """球員編號轉為（標準資料列的）Rk"""
+        return self.rk[np.asarray(ids, dtype=np.int64)]
+
+    def valid_ids(self, ids):
+        ids = np.asarray(ids, dtype=np.int64)
+        return ids[(ids >= 0) & (ids < self.size)]
+
+    def name_set(self, ids):
+        """球隊中球員名稱（小寫、去除空白）的集合"""
+        return set(self.names[self.valid_ids(ids)])
+
+
+def build_player_index(player_data, team_column=None, key_columns=('Player', 'Age')):
+    """
+    由球員數據建立 PlayerIndex。
+    同一位球員（相同的 key_columns）有多列時，優先保留交易球員的合計列（TOT / 2TM），
+    否則保留第一次出現的列；標準列依第一次出現的順序編號。
+    player_data 的 Rk 需已轉為整數。
+    """
+    rows = player_data.reset_index(drop=True)
+    keys = [column for column in key_columns if column in rows]
+    group = rows.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+
+    if team_column is not None and team_column in rows:
+        aggregate = rows[team_column].astype(str).str.fullmatch(AGGREGATE_TEAM_PATTERN).to_numpy(dtype=bool)
+    else:
+        aggregate = np.zeros(len(rows), dtype=bool)
+
+    # 每組依（是否為合計列, 原本順序）排序後取第一列
+    order = np.lexsort((np.arange(len(rows)), ~aggregate, group))
+    first = order[np.r_[True, group[order][1:] != group[order][:-1]]] if len(rows) else order
+    players = rows.iloc[first].reset_index(drop=True)
+    players.insert(0, 'id', np.arange(len(players)))
+
+    rk = rows['Rk'].to_numpy(dtype=np.int64)
+    rk_to_id = np.full(int(rk.max()) + 1 if len(rk) else 0, -1, dtype=np.int64)
+    rk_to_id[rk] = group
+    return PlayerIndex(players, rk_to_id)
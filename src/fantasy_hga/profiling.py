@@ -0,0 +1,196 @@
+import os
+import signal
+import sys
+import time
+from collections import Counter
+
+from .harness import current_run, run_output_path
+
+
+class _Phase:
+    """單一階段的計時器（可重複使用的 context manager）"""
+
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._enter(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._exit(self.name)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class Profiler:
+    """
+    輕量的分階段計時：累計每個階段的牆鐘時間、呼叫次數與評估數。
+    階段可以巢狀（例如 crossover 中的 repair_duplicates），每個階段只計入自己的時間（exclusive）。
+    enabled=False 時 phase() 回傳共用的空 context manager，幾乎沒有額外成本。
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._phases = {}
+        self.reset()
+
+    def reset(self):
+        self.totals = Counter()
+        self.calls = Counter()
+        self.evaluations = Counter()
+        self._stack = []
+        self._started = time.perf_counter()
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NULL_PHASE
+        timer = self._phases.get(name)
+        if timer is None:
+            timer = self._phases[name] = _Phase(self, name)
+        return timer
+
+    def count(self, name, evaluations):
+        """記錄此階段評估的球隊數"""
+        if self.enabled:
+            self.evaluations[name] += evaluations
+
+    def _enter(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            parent, start = self._stack[-1]
+            self.totals[parent] += now - start
+        self._stack.append((name, now))
+
+    def _exit(self, name):
+        now = time.perf_counter()
+        _, start = self._stack.pop()
+        self.totals[name] += now - start
+        self.calls[name] += 1
+        if self._stack:
+            parent, _ = self._stack[-1]
+            self._stack[-1] = (parent, now)
+
+    def breakdown(self):
+        """回傳每個階段的統計（依總時間由大到小）"""
+        elapsed = time.perf_counter() - self._started
+        rows = []
+        for name, total in self.totals.most_common():
+            calls = self.calls[name]
+            evaluations = self.evaluations[name]
+            rows.append({
+                'phase': name,
+                'calls': calls,
+                'total': total,
+                'share': total / elapsed if elapsed > 0 else 0.0,
+                'per_call': total / calls if calls else 0.0,
+                'evals_per_sec': evaluations / total if evaluations and total > 0 else None,
+            })
+        return rows
+
+    def format_breakdown(self):
+        lines = [f"{'phase':<22} {'calls':>9} {'total (s)':>10} {'share':>7} {'per call':>11} {'evals/s':>11}"]
+        for row in self.breakdown():
+            evals = f"{row['evals_per_sec']:,.0f}" if row['evals_per_sec'] is not None else ''
+            lines.append(
+                f"{row['phase']:<22} {row['calls']:>9} {row['total']:>10.3f} {row['share']:>7.1%} "
+                f"{row['per_call'] * 1e6:>9.1f}µs {evals:>11}"
+            )
+        return '\n'.join(lines)
+
+
+class StackSampler:
+    """
+    以 SIGPROF 定時取樣呼叫堆疊，輸出 flamegraph.pl / speedscope 可讀的 collapsed stack 格式。
+    只能在主執行緒、支援 setitimer 的平台（Linux / macOS）使用。
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.stacks = Counter()
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as handle:
+            for stack, count in self.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+
+
+class RunProfiler:
+    """
+    包住一輪實驗的 cProfile 與堆疊取樣（兩者皆為選用）。
+    cprofile_path / collapsed_path 會依輪次加上 .run<N> 後綴，平行執行的各輪不會互相覆蓋。
+    """
+
+    def __init__(self, cprofile_path=None, collapsed_path=None, run=None, interval=0.001):
+        self.cprofile_path = cprofile_path
+        self.collapsed_path = collapsed_path
+        self.run = run
+        self.interval = interval
+
+    def __enter__(self):
+        self._profile = None
+        self._sampler = None
+        if self.cprofile_path:
+            import cProfile
+
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        if self.collapsed_path:
+            if sys.platform == 'win32':
+                raise RuntimeError("Stack sampling requires SIGPROF (Linux / macOS)")
+            self._sampler = StackSampler(self.interval)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._sampler is not None:
+            self._sampler.stop()
+            path = run_output_path(self.collapsed_path, self.run)
+            self._sampler.write(path)
+            print(f"🔥 Collapsed stacks written to {path}")
+        if self._profile is not None:
+            self._profile.disable()
+            path = run_output_path(self.cprofile_path, self.run)
+            self._profile.dump_stats(path)
+            print(f"📊 cProfile stats written to {path}")
+        return False
+
+
+def profile_run(run_function, cprofile_path=None, collapsed_path=None, interval=0.001):
+    """
+    以 RunProfiler 包住 run_function（用 functools.partial 傳給 run_experiments）。
+    輸出檔依 run_once 設定的輪次命名。
+    """
+    with RunProfiler(cprofile_path, collapsed_path, run=current_run()['run'], interval=interval):
+        return run_function()
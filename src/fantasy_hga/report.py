@@ -0,0 +1,117 @@
+import numpy as np
+
+
+def analyze_results_ignore_order(best_team, ideal_team, player_index):
+    """
+    分析算法結果與理想解的準確性（不考慮順序），回傳 (選到的球員名稱, 理想解球員名稱)。
+    """
+    # 將 `best_team` 中的球員編號轉換為球員名稱
+    best_team_names = player_index.name_set(best_team)
+
+    # 將 `ideal_team` 轉換為小寫，確保名稱格式一致
+    ideal_team_names = {name.strip().lower() for name in ideal_team}
+
+    # 計算 TP, FP, FN
+    tp = len(best_team_names & ideal_team_names)  # 正確選擇的球員
+    fp = len(best_team_names - ideal_team_names)  # 錯誤選擇的球員
+    fn = len(ideal_team_names - best_team_names)  # 未選到的正確球員
+
+    # 打印分析結果
+    print("=== 分析結果 ===")
+    print(f"True Positives (TP): {tp} - 正確選擇的球員數量")
+    print(f"False Positives (FP): {fp} - 錯誤選擇的球員數量")
+    print(f"False Negatives (FN): {fn} - 未選到的正確球員數量")
+
+    # 顯示詳細信息
+    print("\n=== 錯誤選擇的球員 ===")
+    print(best_team_names - ideal_team_names)
+
+    print("\n=== 未選到的正確球員 ===")
+    print(ideal_team_names - best_team_names)
+
+    # 計算準確率和召回率
+    accuracy = tp / len(ideal_team_names) if len(ideal_team_names) > 0 else 0
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
+
+    print("\n=== 評估指標 ===")
+    print(f"Accuracy (準確率): {accuracy:.2f}")
+    print(f"Precision (精確率): {precision:.2f}")
+    print(f"Recall (召回率): {recall:.2f}")
+
+    return best_team_names, ideal_team_names
+
+
+def analyze_results_ignore_order_with_plot(best_team, ideal_team, player_index):
+    """
+    分析算法結果與理想解的準確性，並繪製混淆矩陣
+    """
+    import matplotlib.pyplot as plt  # 繪圖套件只在產生報表時才載入
+    from sklearn.metrics import confusion_matrix, ConfusionMatrixDisplay
+
+    best_team_names, ideal_team_names = analyze_results_ignore_order(best_team, ideal_team, player_index)
+
+    # 混淆矩陣的構建（每位球員只算一次）
+    y_true = [1 if name in ideal_team_names else 0 for name in player_index.names]
+    y_pred = [1 if name in best_team_names else 0 for name in player_index.names]
+    cm = confusion_matrix(y_true, y_pred, labels=[1, 0])
+
+    # 繪製混淆矩陣
+    disp = ConfusionMatrixDisplay(confusion_matrix=cm, display_labels=['Selected', 'Not Selected'])
+    disp.plot(cmap='Blues')
+    plt.title("Confusion Matrix")
+    plt.show()
+
+
+# 傷病影響分析可視化
+def visualize_injury_impact(selected_players):
+    import matplotlib.pyplot as plt
+
+    players = [p[0] for p in selected_players]
+    games_played_ratios = [p[3] for p in selected_players]
+    adjusted_scores = [p[1] for p in selected_players]
+    no_injury_scores = [p[4] for p in selected_players]  # 取出 No Injury Score
+
+    # 將 Games Played Ratio 調整到與 Adjusted Score 相同的數值範圍
+    games_played_ratios_scaled = [x * 100 for x in games_played_ratios]
+
+    # 設定柱狀圖的寬度
+    bar_width = 0.25
+    index = np.arange(len(players))  # 設定 x 軸位置
+
+    # 繪製圖表
+    plt.figure(figsize=(16, 7))
+
+    plt.bar(index - bar_width, no_injury_scores, width=bar_width, label='No Injury Score', color='black')
+    plt.bar(index, adjusted_scores, width=bar_width, label='Adjusted Score', color='purple')
+    plt.bar(index + bar_width, games_played_ratios_scaled, width=bar_width, label='Games Played Ratio (Scaled)', color='orange')
+
+    # 調整 x 軸標籤
+    plt.xlabel('Player')
+    plt.ylabel('Impact / Score')
+    plt.title('Injury Impact on Player Scores (With No Injury Score)')
+    plt.xticks(index, players, rotation=45, ha='right')
+
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
+
+
+def analyze_injury_impact(selected_players, plot=True):
+    print("\n=== 傷病影響分析 ===")
+    for player, adjusted_score, position, injury_impact, no_injury_score in selected_players:
+        print(f"{player} ({position}): Adjusted Score = {adjusted_score:.2f}, No Injury Score = {no_injury_score:.2f}, Games Played Ratio = {injury_impact:.2%}")
+    if plot:
+        visualize_injury_impact(selected_players)
+
+
+# 繪製收斂曲線
+def plot_convergence(best_fitness_history, title="Convergence Curve"):
+    import matplotlib.pyplot as plt
+
+    plt.plot(range(len(best_fitness_history)), best_fitness_history, marker='o')
+    plt.title(title)
+    plt.xlabel("Generations")
+    plt.ylabel("Best Fitness")
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,53 @@
+import numpy as np
+
+# 不限位置的格子：任何球員都可以放（Util = 先發的萬用位置、BN = 板凳）
+OPEN_SLOTS = ('Util', 'BN')
+
+# 分數不是全額計算的格子：板凳只算一部分；傷兵名單以健康時的分數（No Injury Score）乘上權重，代表等他回歸的價值
+DEFAULT_SLOT_WEIGHTS = {'BN': 0.5, 'IL': 0.25, 'IL+': 0.25}
+
+# 傷兵名單的資格：出賽比例（出賽場次 / 球隊總場次）低於門檻的球員；IL+ 的門檻較寬
+DEFAULT_INJURY_THRESHOLDS = {'IL': 0.5, 'IL+': 0.75}
+
+
+def slot_tables(positions_required, positions, valid, adjusted_score, no_injury_score, injury_impact,
+                slot_weights=None, injury_thresholds=None):
+    """
+    建立每一格（positions_required 的每個位置）對每位球員的 (價值表, 吻合表)，皆為 (格數 x 球員數)。
+      一般位置（PG / SG / G / SF / PF / F / C）：價值為調整後分數，Pos 需包含該位置代號才吻合
+      Util / BN：任何人都吻合；BN 的價值乘上 slot_weights['BN']
+      IL / IL+：只有出賽比例低於 injury_thresholds 的球員吻合，價值為健康時的分數乘上權重；
+                其他球員放在這兩格不計分
+    吻合表為 False 的格子在 fitness 中扣位置懲罰。建立一次後 fitness 只需查表。
+    """
+    weights = dict(DEFAULT_SLOT_WEIGHTS if slot_weights is None else slot_weights)
+    thresholds = dict(DEFAULT_INJURY_THRESHOLDS if injury_thresholds is None else injury_thresholds)
+    pos_tokens = [p.split('-') if isinstance(p, str) else [] for p in positions]
+
+    slot_value = np.zeros((len(positions_required), len(valid)))
+    slot_match = np.zeros((len(positions_required), len(valid)), dtype=bool)
+    for slot, position in enumerate(positions_required):
+        if position in thresholds:
+            injured = valid & (injury_impact < thresholds[position])
+            slot_match[slot] = injured
+            slot_value[slot] = np.where(injured, no_injury_score * weights.get(position, 1.0), 0.0)
+            continue
+        if position in OPEN_SLOTS:
+            slot_match[slot] = valid
+        else:
+            slot_match[slot] = [position in tokens for tokens in pos_tokens]
+        weight = weights.get(position, 1.0)
+        slot_value[slot] = adjusted_score if weight == 1.0 else adjusted_score * weight
+    return slot_value, slot_match
+
+
+def assign_slot_eligibility(eligibility, score_table):
+    """
+    依分數表的吻合表設定 Util / BN / IL / IL+ 的位置資格，
+    讓初始化、突變與修復的候選名單與 fitness 使用相同的規則（例如 IL 的候選名單只有傷兵）。
+    """
+    positions = score_table.positions_required
+    for position in OPEN_SLOTS + tuple(DEFAULT_INJURY_THRESHOLDS):
+        if position in positions:
+            slot = positions.index(position)
+            eligibility.assign_position(position, np.flatnonzero(score_table.slot_match[slot]))
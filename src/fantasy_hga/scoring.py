@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+
+from .roster import slot_tables
+
+# 計分系統項目對應的數據欄位
+SCORING_COLUMNS = {
+    'FGA': 'FGA',
+    'FG': 'FG',
+    'FTA': 'FTA',
+    'FT': 'FT',
+    '3P': '3P',
+    'PTS': 'PTS',
+    'OREB': 'ORB',
+    'DRB': 'DRB',
+    'AST': 'AST',
+    'STL': 'STL',
+    'BLK': 'BLK',
+    'TOV': 'TOV',
+    'PF': 'PF'
+}
+
+
+class ScoreTable:
+    """
+    賽季分數表：以球員編號 (Rk) 為索引的稠密陣列，載入時建立一次。
+    fitness 計算只需做陣列索引，不必再逐一查詢 DataFrame。
+    """
+
+    def __init__(self, valid, base_score, bonus, injury_impact, names, positions,
+                 positions_required, position_penalty=5, stats=None, slot_weights=None, injury_thresholds=None):
+        self.size = len(valid)
+        self.valid = valid
+        self.base_score = base_score
+        self.bonus = bonus
+        self.no_injury_score = base_score + bonus
+        self.injury_impact = injury_impact
+        self.adjusted_score = self.no_injury_score * injury_impact
+        self.names = names
+        self.positions = positions
+        self.positions_required = list(positions_required)
+        self.position_penalty = position_penalty
+        # 計分用的原始數據（每個欄位一個稠密陣列）
+        self.stats = stats or {}
+
+        # 每個位置的價值表與吻合表（見 roster.slot_tables）：
+        # slot_value[i, 球員編號] 為球員放在第 i 個位置的分數，slot_match[i, 球員編號] 表示是否符合該位置
+        # 先發位置的價值就是調整後分數；Util / BN 任何人都符合，IL / IL+ 只收傷兵
+        self.slot_value, self.slot_match = slot_tables(
+            self.positions_required, positions, valid, self.adjusted_score, self.no_injury_score, injury_impact,
+            slot_weights, injury_thresholds,
+        )
+
+    def contains(self, ids):
+        """回傳每個球員編號是否存在於分數表中"""
+        ids = np.asarray(ids, dtype=np.int64)
+        in_range = (ids >= 0) & (ids < self.size)
+        return in_range & self.valid[np.where(in_range, ids, 0)]
+
+    def score_team(self, team):
+        """
+        計算單一球隊的總分與位置懲罰，回傳 (總分, 位置懲罰, 計分的球員編號)。
+        重複的球員只計算第一次出現的位置，找不到的球員直接略過。
+        """
+        ids = np.asarray(team, dtype=np.int64)
+        keep = self.contains(ids)
+        _, first_index = np.unique(ids, return_index=True)
+        first_seen = np.zeros(len(ids), dtype=bool)
+        first_seen[first_index] = True
+        keep &= first_seen
+
+        slots = np.flatnonzero(keep)
+        selected_ids = ids[slots]
+        total_score = self.slot_value[slots, selected_ids].sum()
+        mismatches = np.count_nonzero(~self.slot_match[slots, selected_ids])
+        return total_score, mismatches * self.position_penalty, selected_ids
+
+    def evaluate_population(self, population):
+        """
+        一次計算整個種群的 fitness。
+        population 為 (P x 位置數) 的整數矩陣（或球隊串列），回傳 (fitness 陣列, 位置懲罰陣列)。
+        規則與 score_team 相同：重複球員只計第一次，找不到的球員（含補位的 -1）略過。
+        """
+        ids = population_matrix(population)
+        if ids.size == 0:
+            return np.zeros(len(ids)), np.zeros(len(ids))
+        keep = self.contains(ids)
+
+        # 每列排序後與前一個比較，標記重複球員（穩定排序保留最先出現的位置）
+        order = np.argsort(ids, axis=1, kind='stable')
+        sorted_ids = np.take_along_axis(ids, order, axis=1)
+        duplicated_sorted = np.zeros(ids.shape, dtype=bool)
+        duplicated_sorted[:, 1:] = sorted_ids[:, 1:] == sorted_ids[:, :-1]
+        duplicated = np.empty(ids.shape, dtype=bool)
+        np.put_along_axis(duplicated, order, duplicated_sorted, axis=1)
+        keep &= ~duplicated
+
+        safe_ids = np.where(keep, ids, 0)
+        slots = np.arange(ids.shape[1])
+        total_scores = np.where(keep, self.slot_value[slots, safe_ids], 0.0).sum(axis=1)
+        mismatches = keep & ~self.slot_match[slots, safe_ids]
+        penalties = np.count_nonzero(mismatches, axis=1) * self.position_penalty
+        return total_scores - penalties, penalties
+
+    def selected_players(self, selected_ids):
+        """組成 (球員, 調整後分數, 位置, 出賽比例, 無傷病分數) 的明細"""
+        return [
+            (self.names[pid], self.adjusted_score[pid], self.positions[pid],
+             self.injury_impact[pid], self.no_injury_score[pid])
+            for pid in selected_ids
+        ]
+
+
+# 雙十 / 大三元使用的數據（順序：PTS, REB, AST, STL, BLK）
+DOUBLE_TRIPLE_STATS = ['PTS', 'REB', 'AST', 'STL', 'BLK']
+
+
+def estimate_double_triple_batch(player_data, std_ratio=0.15, ast_std_ratio=None):
+    """
+    一次推估所有球員的雙十與大三元平均次數，回傳 (雙十陣列, 大三元陣列)。
+    假設各項數據為常態分布、標準差為平均值乘上 std_ratio；
+    季末版本的助攻使用 0.20，可用 ast_std_ratio 另外指定。
+    """
+    means = np.column_stack([
+        player_data['PTS'].to_numpy(dtype=float),
+        player_data['ORB'].to_numpy(dtype=float) + player_data['DRB'].to_numpy(dtype=float),
+        player_data['AST'].to_numpy(dtype=float),
+        player_data['STL'].to_numpy(dtype=float),
+        player_data['BLK'].to_numpy(dtype=float),
+    ])
+    ratios = np.full(len(DOUBLE_TRIPLE_STATS), std_ratio)
+    if ast_std_ratio is not None:
+        ratios[DOUBLE_TRIPLE_STATS.index('AST')] = ast_std_ratio
+    std_devs = means * ratios
+
+    from scipy.special import ndtr  # 只在建立分數表時才載入 scipy
+
+    # P(Stat >= 10)；標準差為 0 時直接以平均值判斷
+    zero_std = std_devs == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        probabilities = 1 - ndtr((10 - means) / np.where(zero_std, 1.0, std_devs))
+    probabilities = np.where(zero_std, (means >= 10).astype(float), probabilities)
+    p_pts, p_reb, p_ast, p_stl, p_blk = probabilities.T
+
+    # 雙十：兩項數據 ≥ 10 的概率（PTS + REB 或 REB + AST 等）
+    double_double_probability = p_pts * p_reb + p_pts * p_ast + p_reb * p_ast
+    # 大三元：三項數據 ≥ 10 的概率（PTS + REB + AST 等）
+    triple_double_probability = p_pts * p_reb * p_ast + p_reb * p_ast * p_blk + p_pts * p_ast * p_blk
+    return double_double_probability, triple_double_probability
+
+
+def population_matrix(population):
+    """把球隊串列轉成 (P x 位置數) 的整數矩陣，長度不足的球隊以 -1 補位"""
+    if isinstance(population, np.ndarray):
+        return np.atleast_2d(population.astype(np.int64, copy=False))
+    width = max((len(team) for team in population), default=0)
+    matrix = np.full((len(population), width), -1, dtype=np.int64)
+    for row, team in enumerate(population):
+        matrix[row, :len(team)] = team
+    return matrix
+
+
+def build_score_table(player_data, scoring_system, positions_required, total_games=82,
+                      std_ratio=0.15, ast_std_ratio=None, position_penalty=5, id_column='Rk',
+                      slot_weights=None, injury_thresholds=None):
+    """
+    由球員數據建立 ScoreTable。
+    同一個球員編號有多列時（例如交易球員），與原本的查詢一樣只取第一列。
+    total_games 可以是固定場次，或是存放球隊總場次的欄位名稱；
+    std_ratio / ast_std_ratio 傳給 estimate_double_triple_batch。
+    id_column 為球員編號欄位（預設 Rk；使用 PlayerIndex 時為 id）。
+    slot_weights / injury_thresholds 為板凳與傷兵名單的設定（見 roster.slot_tables）。
+    """
+    rk = pd.to_numeric(player_data[id_column], errors='coerce')
+    players = player_data[rk.notna()].copy()
+    players[id_column] = rk[rk.notna()].astype(np.int64)
+    players = players.drop_duplicates(subset=id_column, keep='first')
+
+    ids = players[id_column].to_numpy()
+    size = int(ids.max()) + 1 if len(ids) else 0
+
+    # 基本分數
+    base = np.zeros(len(players))
+    for key, weight in scoring_system.items():
+        base += players[SCORING_COLUMNS[key]].to_numpy(dtype=float) * weight
+
+    # 雙十與大三元額外分數
+    average_double_double, average_triple_double = estimate_double_triple_batch(players, std_ratio, ast_std_ratio)
+    bonus = average_double_double * 2.5 + average_triple_double * 5
+
+    # 傷病因素：出賽場次 / 球隊總場次
+    games_played = pd.to_numeric(players['G'], errors='coerce').to_numpy(dtype=float)
+    if isinstance(total_games, str):
+        team_total_games = players[total_games].to_numpy(dtype=float)
+    else:
+        team_total_games = np.full(len(players), float(total_games))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        injury = np.where(team_total_games > 0, games_played / team_total_games, 0.0)
+
+    valid = np.zeros(size, dtype=bool)
+    valid[ids] = True
+
+    def dense(values, fill, dtype=float):
+        column = np.full(size, fill, dtype=dtype)
+        column[ids] = values
+        return column
+
+    return ScoreTable(
+        valid,
+        dense(base, 0.0),
+        dense(bonus, 0.0),
+        dense(injury, 0.0),
+        dense(players['Player'].to_numpy(), None, dtype=object),
+        dense(players['Pos'].to_numpy(), None, dtype=object),
+        positions_required,
+        position_penalty,
+        {column: dense(players[column].to_numpy(dtype=float), 0.0) for column in SCORING_COLUMNS.values()},
+        slot_weights,
+        injury_thresholds,
+    )
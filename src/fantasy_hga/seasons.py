@@ -0,0 +1,133 @@
+from pathlib import Path
+
+import pandas as pd
+
+from .cache import read_csv_cached
+
+# 專案的 data/ 資料夾
+DATA_DIR = Path(__file__).resolve().parents[2] / 'data'
+
+# 設定球隊位置需求
+POSITIONS_REQUIRED = ['PG', 'SG', 'G', 'G', 'SF', 'PF', 'F', 'F', 'C', 'C', 'Util', 'Util', 'BN', 'BN', 'BN', 'IL', 'IL+']
+
+# 預設填入球員的先發位置（完整名單另外包含 Util、板凳與傷兵名單，見 roster.py）
+STARTING_SLOTS = ['PG', 'SG', 'G', 'G', 'SF', 'PF', 'F', 'F', 'C', 'C']
+
+# 設定Fantasy計分系統
+SCORING_SYSTEM = {
+    'FGA': -0.9,
+    'FG': 2,  # 命中次數
+    'FTA': -1.5,
+    'FT': 2,  # 罰球命中次數
+    '3P': 1.75,  # 三分命中次數
+    'PTS': 0.75,  # 得分
+    'OREB': 1.5,  # 進攻籃板
+    'DRB': 1,     # 防守籃板
+    'AST': 1.5,   # 助攻
+    'STL': 3,     # 抄截
+    'BLK': 3.5,   # 阻攻
+    'TOV': -1,    # 失誤
+    'PF': -0.25   # 個人犯規
+}
+
+# 涉及計算的數據欄位
+NUMERIC_COLUMNS = ['PTS', 'AST', 'STL', 'BLK', 'TOV', 'FGA', 'FG', 'FTA', 'FT', '3P', 'ORB', 'DRB', 'PF']
+
+# 載入時需要的欄位（球隊欄位依賽季為 Tm 或 Team）
+PLAYER_COLUMNS = ['Rk', 'Player', 'Age', 'Pos', 'G']
+
+# 各賽季的設定
+# local_search：'top_pts' = 換成該位置 PTS 最高的球員（上季版本）
+#               'top15_fitness' = 從該位置 PTS 前 15 名中選基本分數最高者（本季版本）
+#               'best_improvement' = 單一交換鄰域的 best-improvement 搜尋（localsearch.OneSwapSearch）
+SEASONS = {
+    'last': {
+        'data_file': 'nba-player-data last season.csv',
+        'team_column': 'Tm',
+        'games_file': None,
+        'generations': 250,
+        'ast_std_ratio': None,
+        'local_search': 'top_pts',
+        'shuffle_pools': False,
+        'target_players': [
+            "jalen brunson", "luka doncic", "shai gilgeous-alexander", "tyrese haliburton",
+            "kevin durant", "giannis antetokounmpo", "anthony davis", "lebron james",
+            "domantas sabonis", "nikola jokic"
+        ],
+        'history_files': {'chaos': 'chaos_last_year.npy', 'random': 'normal_last_year.npy'},
+        'plot_titles': {'chaos': "Convergence Curve", 'random': "Convergence Curve"},
+    },
+    'mid': {
+        'data_file': 'nba-player-data this season mid.csv',
+        'team_column': 'Team',
+        'games_file': 'game.csv',  # 需有 "Teamx" 與 "Gx" 欄位；沒有此檔案時以 82 場計算
+        'generations': 300,
+        'ast_std_ratio': None,
+        'local_search': 'top15_fitness',
+        'shuffle_pools': True,  # 打散前30名的順序
+        'target_players': [
+            "cade cunningham", "trae young", "shai gilgeous-alexander", "anthony edwards",
+            "jayson tatum", "karl-anthony towns", "anthony davis", "lebron james",
+            "victor wembanyama", "nikola jokić"
+        ],
+        'history_files': {'chaos': 'chaos.npy', 'random': 'normal.npy'},
+        'plot_titles': {'chaos': "Convergence Curve (Chaotic GA - 5th Run)", 'random': "Convergence Curve (Normal GA)"},
+    },
+    'end': {
+        'data_file': 'nba-player-data this season final.csv',
+        'team_column': 'Team',
+        'games_file': None,
+        'generations': 150,
+        'ast_std_ratio': 0.20,
+        'local_search': 'top15_fitness',
+        'shuffle_pools': False,
+        'target_players': [
+            "james harden", "shai gilgeous-alexander", "anthony edwards", "trae young",
+            "cade cunningham", "jayson tatum", "giannis antetokounmpo", "karl-anthony towns",
+            "lebron james", "nikola jokic"
+        ],
+        'history_files': {'chaos': 'chaos_this_end.npy', 'random': 'normal_this_end.npy'},
+        'plot_titles': {'chaos': "Convergence Curve", 'random': "Convergence Curve"},
+    },
+}
+
+
+def load_player_data(season, data_dir=DATA_DIR, use_cache=True):
+    """
+    讀取賽季球員數據（SEASONS 中設定的檔案），詳見 load_player_csv。
+    """
+    config = SEASONS[season]
+    data_dir = Path(data_dir)
+    games_path = None if config['games_file'] is None else data_dir / config['games_file']
+    return load_player_csv(data_dir / config['data_file'], config['team_column'], games_path, use_cache)
+
+
+def load_player_csv(path, team_column='Team', games_path=None, use_cache=True):
+    """
+    讀取球員數據 CSV（賽季數據或 fantasy_hga.synthetic 產生的球員池）：
+    轉換數字欄位、Rk 轉為整數球員編號。
+    有指定 games_path 時合併球隊總場次為 Total_Games 欄位（檔案不存在或缺少球隊時為 82 場）。
+    use_cache=True 時經由 read_csv_cached 從 .npz 快取只載入需要的欄位。
+    """
+    columns = PLAYER_COLUMNS + [team_column] + NUMERIC_COLUMNS
+    player_data = read_csv_cached(path, columns, use_cache=use_cache)
+
+    # 讀取球隊總出賽場次數據
+    if games_path is not None:
+        if Path(games_path).exists():
+            team_games = read_csv_cached(games_path, use_cache=use_cache)
+            team_games = team_games.rename(columns={"Teamx": team_column, "Gx": "Total_Games"})
+            player_data = player_data.merge(team_games, on=team_column, how="left")
+        else:
+            player_data['Total_Games'] = 82
+        player_data['Total_Games'] = pd.to_numeric(player_data['Total_Games'], errors='coerce').fillna(82).astype(int)
+
+    # 確保數據類型正確，並將涉及計算的數據欄位轉為數字類型
+    for col in NUMERIC_COLUMNS:
+        player_data[col] = pd.to_numeric(player_data[col], errors='coerce').fillna(0)
+
+    # 將 Rk 轉為整數球員編號（移除重複的表頭列與空白列）
+    player_data['Rk'] = pd.to_numeric(player_data['Rk'], errors='coerce')
+    player_data = player_data.dropna(subset=['Rk']).reset_index(drop=True)
+    player_data['Rk'] = player_data['Rk'].astype(int)
+    return player_data
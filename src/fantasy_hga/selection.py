@@ -0,0 +1,80 @@
+import numpy as np
+
+# 親代選擇方式：roulette = 依 fitness 比例、rank = 線性排名、sigma = sigma scaling、tournament = 錦標賽
+SELECTIONS = ('roulette', 'rank', 'sigma', 'tournament')
+
+
+def roulette_weights(fitness):
+    """
+    依 fitness 比例的權重。fitness 全為非負時就是 fitness 本身；
+    有負值時整體平移，讓最差的個體權重為 0（其餘個體的相對差距不變）。
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    lowest = fitness.min()
+    return fitness - lowest if lowest < 0 else fitness
+
+
+def rank_weights(fitness, pressure=1.5):
+    """
+    線性排名權重：最差的個體為 2 - pressure、最好的為 pressure（1 <= pressure <= 2），
+    只看名次不看 fitness 差距，可避免少數超強個體壟斷交配。
+    """
+    if not 1 <= pressure <= 2:
+        raise ValueError("pressure must be between 1 and 2")
+    fitness = np.asarray(fitness, dtype=float)
+    size = len(fitness)
+    if size == 1:
+        return np.ones(1)
+    ranks = np.empty(size)
+    ranks[np.argsort(fitness, kind='stable')] = np.arange(size)
+    return (2 - pressure) + 2 * (pressure - 1) * ranks / (size - 1)
+
+
+def sigma_weights(fitness, scale=2.0):
+    """
+    Sigma scaling：權重為 max(0, 1 + (f - 平均) / (scale × 標準差))。
+    族群收斂時（標準差接近 0）所有個體權重相同。
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    sigma = fitness.std()
+    if sigma < 1e-12:
+        return np.ones(len(fitness))
+    return np.maximum(0.0, 1 + (fitness - fitness.mean()) / (scale * sigma))
+
+
+def sample_from_weights(weights, count, rng=np.random):
+    """
+    依權重抽出 count 個索引（可重複）：累積分布只建立一次，所有亂數以 searchsorted 一次查完，
+    總成本 O(P + count log P)。權重總和為 0 時改為均勻抽樣。
+    """
+    cumulative = np.cumsum(weights, dtype=float)
+    total = cumulative[-1]
+    if not total > 0:
+        return rng.randint(0, len(cumulative), size=count)
+    indices = np.searchsorted(cumulative, rng.random_sample(count) * total, side='right')
+    return np.minimum(indices, len(cumulative) - 1)  # 浮點誤差造成的超界
+
+
+def tournament_indices(fitness, count, size=3, rng=np.random):
+    """錦標賽選擇：每次隨機抽 size 個個體（可重複），取 fitness 最高者；全部一次以矩陣計算"""
+    fitness = np.asarray(fitness, dtype=float)
+    contestants = rng.randint(0, len(fitness), size=(count, size))
+    winners = np.argmax(fitness[contestants], axis=1)
+    return contestants[np.arange(count), winners]
+
+
+def select_parents(fitness, count, method='roulette', rng=np.random, tournament_size=3, pressure=1.5):
+    """
+    依 method 從族群中選出 count 個親代，回傳族群索引（np.ndarray）。
+    每個世代呼叫一次：權重與累積分布只建立一次，所有親代以一次向量化抽樣取得。
+    rng 預設為 NumPy 的全域亂數（由 seed_everything 設定種子）。
+    """
+    if method == 'roulette':
+        return sample_from_weights(roulette_weights(fitness), count, rng)
+    if method == 'rank':
+        return sample_from_weights(rank_weights(fitness, pressure), count, rng)
+    if method == 'sigma':
+        return sample_from_weights(sigma_weights(fitness), count, rng)
+    if method == 'tournament':
+        return tournament_indices(fitness, count, tournament_size, rng)
+    raise ValueError(f"Unknown selection method: {method}")
@@ -0,0 +1,82 @@
+import time
+from collections import deque
+
+
+class EarlyStopping:
+    """
+    依收斂狀況提前結束演化的規則，每個世代只需 O(1) 的檢查：
+      patience         連續 N 個世代最佳 fitness 沒有進步（進步幅度需超過 min_delta）
+      plateau_window   最近 N 個世代的相對進步小於 plateau_tol（(目前 - N 代前) / |N 代前|）
+      target_fitness   最佳 fitness 達到已知上限（例如精確解）的 1 - target_tol
+      time_budget      這一輪已經執行超過的秒數
+    未設定的規則不會檢查；全部未設定時永遠不會提前停止。
+    """
+
+    def __init__(self, patience=None, min_delta=1e-9, plateau_window=None, plateau_tol=1e-4,
+                 target_fitness=None, target_tol=1e-9, time_budget=None):
+        for name, value in (('patience', patience), ('plateau_window', plateau_window)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be >= 1")
+        self.patience = patience
+        self.min_delta = min_delta
+        self.plateau_window = plateau_window
+        self.plateau_tol = plateau_tol
+        self.target_fitness = target_fitness
+        self.target_tol = target_tol
+        self.time_budget = time_budget
+        self.start()
+
+    @property
+    def enabled(self):
+        return any(rule is not None for rule in
+                   (self.patience, self.plateau_window, self.target_fitness, self.time_budget))
+
+    def start(self):
+        """每一輪開始時呼叫：重設最佳值、計數與計時"""
+        self.best = float('-inf')
+        self.stalled = 0
+        self.window = deque(maxlen=self.plateau_window + 1) if self.plateau_window else None
+        self.started = time.perf_counter()
+        self.reason = None
+
+    def state(self):
+        """可存進檢查點的狀態（JSON 可序列化）"""
+        return {
+            'best': self.best if self.best != float('-inf') else None,
+            'stalled': self.stalled,
+            'window': list(self.window) if self.window is not None else None,
+            'elapsed': time.perf_counter() - self.started,
+        }
+
+    def restore(self, state):
+        """由檢查點還原（時間預算從已經使用的時間繼續計算）"""
+        self.best = float('-inf') if state['best'] is None else state['best']
+        self.stalled = state['stalled']
+        if self.window is not None and state['window'] is not None:
+            self.window.extend(state['window'])
+        self.started = time.perf_counter() - state['elapsed']
+
+    def update(self, best_fitness):
+        """
+        記錄這個世代的最佳 fitness，需要停止時回傳原因（字串），否則回傳 None。
+        """
+        if best_fitness > self.best + self.min_delta:
+            self.stalled = 0
+        else:
+            self.stalled += 1
+        self.best = max(self.best, best_fitness)
+
+        if self.target_fitness is not None and self.best >= self.target_fitness - abs(self.target_fitness) * self.target_tol:
+            self.reason = f"reached target fitness {self.target_fitness}"
+        elif self.patience is not None and self.stalled >= self.patience:
+            self.reason = f"no improvement for {self.stalled} generations"
+        elif self.window is not None:
+            self.window.append(self.best)
+            if len(self.window) == self.window.maxlen:
+                before = self.window[0]
+                improvement = (self.best - before) / abs(before) if before else self.best - before
+                if improvement < self.plateau_tol:
+                    self.reason = f"relative improvement {improvement:.2e} over {self.plateau_window} generations"
+        if self.reason is None and self.time_budget is not None and time.perf_counter() - self.started >= self.time_budget:
+            self.reason = f"time budget of {self.time_budget} seconds used"
+        return self.reason
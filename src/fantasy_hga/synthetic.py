@@ -0,0 +1,195 @@
+"""
+合成球員池產生器，欄位與 data/nba-player-data *.csv 相同，用來測試大型球員池（最多 10^5 列）。
+
+    python -m fantasy_hga.synthetic 50000 --output synthetic_50000.csv --seed 1
+    python -m fantasy_hga.synthetic 5000 --positions PG=1,SG=1,SF=1,PF=1,C=2,PG-SG=0.5
+
+各項數據由同一個「能力」潛在變數產生，因此上場時間、出手、得分、助攻之間有合理的相關性；
+各位置的每 36 分鐘數據（助攻、籃板、阻攻、三分出手比例）依位置原型決定。
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# 與本季數據相同的欄位順序
+COLUMNS = ['Rk', 'Player', 'Age', 'Team', 'Pos', 'G', 'GS', 'MP', 'FG', 'FGA', 'FG%', '3P', '3PA', '3P%',
+           '2P', '2PA', '2P%', 'eFG%', 'FT', 'FTA', 'FT%', 'ORB', 'DRB', 'TRB', 'AST', 'STL', 'BLK', 'TOV',
+           'PF', 'PTS', 'Awards']
+
+TEAMS = ['ATL', 'BOS', 'BRK', 'CHO', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW', 'HOU', 'IND', 'LAC', 'LAL', 'MEM',
+         'MIA', 'MIL', 'MIN', 'NOP', 'NYK', 'OKC', 'ORL', 'PHI', 'PHO', 'POR', 'SAC', 'SAS', 'TOR', 'UTA', 'WAS']
+
+# 預設的位置分布（本季季末數據的比例）
+DEFAULT_POSITION_WEIGHTS = {'PG': 95, 'SG': 138, 'SF': 85, 'PF': 93, 'C': 89}
+
+# 各位置原型的每 36 分鐘數據：出手、三分出手比例、助攻、進攻籃板、防守籃板、抄截、阻攻
+ARCHETYPES = {
+    'PG': {'FGA': 15.0, '3PA_share': 0.42, 'AST': 7.0, 'ORB': 0.6, 'DRB': 3.6, 'STL': 1.4, 'BLK': 0.3},
+    'SG': {'FGA': 14.5, '3PA_share': 0.45, 'AST': 3.8, 'ORB': 0.7, 'DRB': 3.8, 'STL': 1.2, 'BLK': 0.35},
+    'SF': {'FGA': 13.0, '3PA_share': 0.40, 'AST': 2.8, 'ORB': 1.2, 'DRB': 5.0, 'STL': 1.1, 'BLK': 0.6},
+    'PF': {'FGA': 12.5, '3PA_share': 0.30, 'AST': 2.5, 'ORB': 2.0, 'DRB': 6.5, 'STL': 0.9, 'BLK': 0.9},
+    'C': {'FGA': 11.0, '3PA_share': 0.12, 'AST': 2.4, 'ORB': 3.4, 'DRB': 8.0, 'STL': 0.8, 'BLK': 1.6},
+}
+
+
+def parse_position_weights(text):
+    """把 'PG=1,SG=1,C=2' 轉成 {'PG': 1.0, 'SG': 1.0, 'C': 2.0}"""
+    weights = {}
+    for item in text.split(','):
+        position, _, weight = item.partition('=')
+        weights[position.strip()] = float(weight) if weight else 1.0
+    return weights
+
+
+def archetype(position):
+    """位置原型；複合位置（例如 PG-SG）取各位置的平均"""
+    tokens = [token for token in position.split('-') if token in ARCHETYPES]
+    if not tokens:
+        raise ValueError(f"Unknown position: {position}")
+    return {key: np.mean([ARCHETYPES[token][key] for token in tokens]) for key in ARCHETYPES['PG']}
+
+
+def generate_player_pool(num_players, seed=0, position_weights=None, traded_fraction=0.1, season_games=82,
+                         team_column='Team', aggregate_label='2TM'):
+    """
+    產生 num_players 位球員的數據（DataFrame，欄位與季末 CSV 相同）。
+    traded_fraction 比例的球員會被交易：一列合計列（aggregate_label）加上兩隊各一列，三列共用同一個 Rk。
+    Rk 依得分由高到低排列，與 Basketball Reference 的數據相同。
+    上季格式可使用 team_column='Tm', aggregate_label='TOT'。
+    """
+    rng = np.random.default_rng(seed)
+    weights = DEFAULT_POSITION_WEIGHTS if position_weights is None else position_weights
+    positions = list(weights)
+    probabilities = np.array([weights[p] for p in positions], dtype=float)
+    pos = rng.choice(positions, size=num_players, p=probabilities / probabilities.sum())
+    rates = {key: np.empty(num_players) for key in ARCHETYPES['PG']}
+    for position in positions:
+        mask = pos == position
+        for key, value in archetype(position).items():
+            rates[key][mask] = value
+
+    # 能力潛在變數：影響上場時間與各項數據
+    quality = rng.standard_normal(num_players)
+    age = np.clip(np.round(rng.normal(26.3, 3.9, num_players)), 19, 40)
+    mp = np.clip(23.4 + 7.5 * (0.8 * quality + 0.6 * rng.standard_normal(num_players)), 2.0, 38.0)
+    availability = rng.beta(3.0, 1.3, num_players)
+    games = np.maximum(1, rng.binomial(season_games, availability))
+    starter_share = 1 / (1 + np.exp(-(mp - 26.0) / 2.5))
+    games_started = np.round(games * starter_share)
+
+    def per_game(per_36, spread=0.3, quality_weight=0.6):
+        noise = quality_weight * quality + np.sqrt(1 - quality_weight ** 2) * rng.standard_normal(num_players)
+        return per_36 * np.exp(spread * noise) * mp / 36
+
+    fga = per_game(rates['FGA'], 0.18, 0.7)
+    three_share = np.clip(rates['3PA_share'] * np.exp(0.3 * rng.standard_normal(num_players)), 0, 0.9)
+    three_pa = fga * three_share
+    two_pa = fga - three_pa
+    three_pct = np.clip(rng.normal(0.35, 0.05, num_players), 0.0, 0.6)
+    two_pct = np.clip(rng.normal(0.53, 0.05, num_players) + 0.03 * (rates['ORB'] > 2), 0.3, 0.75)
+    three_p = three_pa * three_pct
+    two_p = two_pa * two_pct
+    fg = three_p + two_p
+    fta = fga * np.clip(0.25 * np.exp(0.35 * rng.standard_normal(num_players) + 0.1 * quality), 0, 1)
+    ft_pct = np.clip(rng.normal(0.77, 0.08, num_players), 0.4, 0.95)
+    ft = fta * ft_pct
+    orb = per_game(rates['ORB'], 0.35, 0.2)
+    drb = per_game(rates['DRB'], 0.25, 0.4)
+    ast = per_game(rates['AST'], 0.35, 0.6)
+    stl = per_game(rates['STL'], 0.3, 0.3)
+    blk = per_game(rates['BLK'], 0.45, 0.2)
+    tov = per_game(1.2 + 0.1 * rates['AST'] + 0.05 * rates['FGA'], 0.25, 0.5)
+    pf = per_game(np.full(num_players, 3.0), 0.2, 0.0)
+    pts = 2 * two_p + 3 * three_p + ft
+
+    def ratio(made, attempts):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(attempts > 0, made / attempts, np.nan)
+
+    players = pd.DataFrame({
+        'Player': [f"Synthetic Player {i + 1}" for i in range(num_players)],
+        'Age': age.astype(int),
+        'Team': rng.choice(TEAMS, size=num_players),
+        'Pos': pos,
+        'G': games,
+        'GS': games_started.astype(int),
+        'MP': mp,
+        'FG': fg, 'FGA': fga, 'FG%': ratio(fg, fga),
+        '3P': three_p, '3PA': three_pa, '3P%': ratio(three_p, three_pa),
+        '2P': two_p, '2PA': two_pa, '2P%': ratio(two_p, two_pa),
+        'eFG%': ratio(fg + 0.5 * three_p, fga),
+        'FT': ft, 'FTA': fta, 'FT%': ratio(ft, fta),
+        'ORB': orb, 'DRB': drb, 'TRB': orb + drb,
+        'AST': ast, 'STL': stl, 'BLK': blk, 'TOV': tov, 'PF': pf, 'PTS': pts,
+        'Awards': np.nan,
+    })
+    players = players.sort_values('PTS', ascending=False, kind='stable').reset_index(drop=True)
+    players.insert(0, 'Rk', np.arange(1, num_players + 1))
+
+    # 交易球員：合計列後面接著兩隊各一列（出賽場次拆開、數據加上小幅擾動）
+    traded = rng.random(num_players) < traded_fraction
+    if traded.any():
+        aggregate = players[traded].copy()
+        first_team = aggregate.copy()
+        second_team = aggregate.copy()
+        split = rng.uniform(0.2, 0.8, traded.sum())
+        first_team['G'] = np.maximum(1, np.round(aggregate['G'] * split)).astype(int)
+        second_team['G'] = np.maximum(1, aggregate['G'] - first_team['G']).astype(int)
+        for team_rows in (first_team, second_team):
+            team_rows['GS'] = np.minimum(team_rows['GS'], team_rows['G'])
+            team_rows['Team'] = rng.choice(TEAMS, size=len(team_rows))
+            jitter = rng.uniform(0.9, 1.1, size=(len(team_rows), 1))
+            stat_columns = ['MP', 'FG', 'FGA', '3P', '3PA', '2P', '2PA', 'FT', 'FTA', 'ORB', 'DRB', 'TRB',
+                            'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS']
+            team_rows[stat_columns] = team_rows[stat_columns].to_numpy() * jitter
+        aggregate['Team'] = aggregate_label
+        players = pd.concat([
+            players[~traded].assign(_section=0), aggregate.assign(_section=0),
+            first_team.assign(_section=1), second_team.assign(_section=2),
+        ])
+        players['_row'] = players.index
+        players = players.sort_values(['_row', '_section'], kind='stable').reset_index(drop=True)
+        players = players.drop(columns=['_row', '_section'])
+
+    # 與原始資料相同的小數位數
+    percentages = ['FG%', '3P%', '2P%', 'eFG%', 'FT%']
+    counting = [column for column in COLUMNS[7:-1] if column not in percentages]
+    players[counting] = players[counting].round(1)
+    players[percentages] = players[percentages].round(3)
+    return players.rename(columns={'Team': team_column})[
+        [team_column if column == 'Team' else column for column in COLUMNS]
+    ]
+
+
+def write_player_pool(path, num_players, **kwargs):
+    """產生球員池並寫成 CSV，回傳 DataFrame"""
+    players = generate_player_pool(num_players, **kwargs)
+    players.to_csv(path, index=False)
+    return players
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='fantasy_hga.synthetic', description="Generate a synthetic player pool CSV")
+    parser.add_argument('players', type=int, help="球員人數（最多 10^5 左右）")
+    parser.add_argument('--output', required=True, help="輸出的 CSV 路徑")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--positions', type=parse_position_weights, default=None,
+                        help="位置分布，例如 PG=1,SG=1,SF=1,PF=1,C=2,PG-SG=0.5")
+    parser.add_argument('--traded-fraction', type=float, default=0.1, help="被交易球員的比例")
+    parser.add_argument('--last-season-format', action='store_true', help="使用上季格式（Tm 欄位、TOT 合計列）")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    team_column, aggregate_label = ('Tm', 'TOT') if args.last_season_format else ('Team', '2TM')
+    players = write_player_pool(
+        args.output, args.players, seed=args.seed, position_weights=args.positions,
+        traded_fraction=args.traded_fraction, team_column=team_column, aggregate_label=aggregate_label
+    )
+    print(f"Wrote {len(players)} rows ({args.players} players) to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+import json
+import os
+import time
+
+from .harness import current_run
+
+
+class Telemetry:
+    """
+    每個世代的精簡紀錄（JSONL），取代每代印出整隊球員明細。
+    每筆紀錄：run, seed, generation, best, mean, std, evals, cache_hits, cache_misses, gen_time, elapsed。
+    evals 為所有 fitness 計算：快取查詢（命中 + 未命中）加上不經過快取的評估（子代批次計分、局部搜尋的交換）。
+
+    path=None 時不寫檔；sample_every=N 表示每 N 個世代寫一筆（最後一代一定會寫）；
+    print_every=N 表示每 N 個世代在終端機印一行進度（0 = 不印）。
+    檔案以 O_APPEND 開啟、每筆紀錄一次 write，平行執行的多輪實驗可以寫入同一個檔案。
+    """
+
+    def __init__(self, path=None, sample_every=1, print_every=10, append=False):
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        self.path = None if path is None else os.fspath(path)
+        self.sample_every = sample_every
+        self.print_every = print_every
+        self._fd = None
+        if self.path is not None and not append:
+            open(self.path, 'w').close()  # 新的實驗從空檔案開始
+        self.start_run()
+
+    def __getstate__(self):
+        # 子行程自行開啟檔案（附加模式），不傳遞檔案描述子
+        state = self.__dict__.copy()
+        state['_fd'] = None
+        return state
+
+    def start_run(self, memo_stats=None, evaluations=0):
+        """每一輪開始時呼叫：重設計時、快取統計與評估次數的基準"""
+        self.run_info = current_run()
+        self.run_start = time.perf_counter()
+        self.last_hits = memo_stats['hits'] if memo_stats else 0
+        self.last_misses = memo_stats['misses'] if memo_stats else 0
+        self.last_evaluations = evaluations
+
+    def generation(self, generation, best, mean, std, memo_stats, gen_time, final=False, evaluations=0):
+        """
+        記錄一個世代；final=True 表示這一輪的最後一代。
+        evaluations 為不經過快取的評估次數（累計值，與 memo_stats 相同由此計算每代的差值）。
+        """
+        hits = memo_stats['hits'] - self.last_hits
+        misses = memo_stats['misses'] - self.last_misses
+        direct = evaluations - self.last_evaluations
+        self.last_hits = memo_stats['hits']
+        self.last_misses = memo_stats['misses']
+        self.last_evaluations = evaluations
+
+        number = generation + 1
+        if self.path is not None and (final or number % self.sample_every == 0):
+            self.write({
+                'run': self.run_info['run'],
+                'seed': self.run_info['seed'],
+                'generation': number,
+                'best': float(best),
+                'mean': float(mean),
+                'std': float(std),
+                'evals': hits + misses + direct,
+                'cache_hits': hits,
+                'cache_misses': misses,
+                'gen_time': round(gen_time, 6),
+                'elapsed': round(time.perf_counter() - self.run_start, 6),
+            })
+        if self.print_every and (final or number % self.print_every == 0):
+            print(f"Generation {number}: Best Fitness = {best}, Mean = {mean:.2f}, Diversity = {std:.4f}")
+
+    def write(self, record):
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(self._fd, (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8'))
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def read_telemetry(path):
+    """讀回 JSONL 紀錄（list of dict）"""
+    with open(path, encoding='utf-8') as handle:
+        return [json.loads(line) for line in handle if line.strip()]
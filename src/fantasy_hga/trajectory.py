@@ -0,0 +1,119 @@
+"""
+軌跡式（單一解）引擎：模擬退火與禁忌搜尋。
+與 GA 使用相同的球隊編碼（PlayerIndex 編號、positions_required 的位置）與 fitness 定義，
+鄰域為「把某個位置換成另一位符合資格、不在隊中的球員」。
+"""
+import math
+import random
+
+import numpy as np
+
+from .incremental import ScoredTeam
+
+
+class SwapMoves:
+    """
+    所有 (位置, 候選球員) 交換的攤平陣列：slots[k] 位置換成 players[k] 時，該位置的貢獻為 values[k]
+    （該格的價值，不符合位置時扣位置懲罰；與 ScoredTeam 的每格分數相同）。
+    """
+
+    def __init__(self, score_table, slot_pools, width):
+        width = min(width, len(slot_pools.sizes))
+        sizes = slot_pools.sizes[:width]
+        self.slots = np.repeat(np.arange(width), sizes)
+        self.players = np.concatenate([
+            slot_pools.flat[slot_pools.offsets[slot]:slot_pools.offsets[slot] + sizes[slot]] for slot in range(width)
+        ]) if width else np.empty(0, dtype=np.int64)
+        known = score_table.contains(self.players)
+        safe = np.where(known, self.players, 0)
+        values = score_table.slot_value[self.slots, safe] - \
+            score_table.position_penalty * ~score_table.slot_match[self.slots, safe]
+        self.values = np.where(known, values, 0.0)
+        # 模擬退火逐一抽樣用的 list 版本
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64).tolist()
+        self.sizes = sizes.tolist()
+        self.movable = [slot for slot in range(width) if self.sizes[slot] > 0]
+        self.player_list = self.players.tolist()
+        self.value_list = self.values.tolist()
+
+
+def slot_contribution(team, slot):
+    return team.slot_scores[slot] - team.slot_penalties[slot]
+
+
+def simulated_annealing(score_table, moves, team, iterations=20000, start_temperature=10.0, final_temperature=0.01,
+                        stopping=None):
+    """
+    模擬退火：每一步隨機挑一個位置與一位候選球員，進步就接受，退步則以 exp(Δ / T) 的機率接受。
+    溫度由 start_temperature 依等比遞減到 final_temperature。
+    回傳 (最佳球隊, 最佳 fitness, 每步的最佳 fitness, 實際步數)。
+    """
+    team = ScoredTeam(score_table, team)
+    members = set(team)
+    fitness = team.fitness
+    best_team, best_fitness = list(team), fitness
+    history = []
+    cooling = (final_temperature / start_temperature) ** (1 / max(iterations - 1, 1))
+    temperature = start_temperature
+    step = 0
+    for step in range(1, iterations + 1):
+        slot = moves.movable[random.randrange(len(moves.movable))]
+        index = moves.offsets[slot] + random.randrange(moves.sizes[slot])
+        player_id = moves.player_list[index]
+        if player_id not in members:
+            delta = moves.value_list[index] - slot_contribution(team, slot)
+            if delta >= 0 or random.random() < math.exp(delta / temperature):
+                members.discard(team[slot])
+                members.add(player_id)
+                team[slot] = player_id
+                fitness = team.fitness
+                if fitness > best_fitness:
+                    best_team, best_fitness = list(team), fitness
+        temperature *= cooling
+        history.append(best_fitness)
+        if stopping is not None and stopping.update(best_fitness) is not None:
+            break
+    return best_team, best_fitness, history, step
+
+
+def tabu_search(score_table, moves, team, iterations=500, tenure=7, stopping=None, num_players=None):
+    """
+    禁忌搜尋：每一步以陣列一次評估所有交換，選擇最好的非禁忌交換（即使會退步）。
+    被換下的球員在 tenure 步內不能再回到隊中，除非該交換能超越目前的最佳解（aspiration）。
+    回傳 (最佳球隊, 最佳 fitness, 每步的最佳 fitness, 實際步數)。
+    """
+    team = ScoredTeam(score_table, team)
+    if num_players is None:
+        num_players = int(max(moves.players.max(initial=-1), max(team, default=-1))) + 1
+    in_team = np.zeros(num_players, dtype=bool)
+    in_team[[player_id for player_id in team if 0 <= player_id < num_players]] = True
+    tabu_until = np.zeros(num_players, dtype=np.int64)
+
+    fitness = team.fitness
+    best_team, best_fitness = list(team), fitness
+    history = []
+    step = 0
+    for step in range(1, iterations + 1):
+        current = np.array([slot_contribution(team, slot) for slot in range(len(team))])
+        gains = moves.values - current[moves.slots]
+        allowed = ~in_team[moves.players]
+        allowed &= (tabu_until[moves.players] <= step) | (fitness + gains > best_fitness + 1e-9)
+        if not allowed.any():
+            break
+        best_move = int(np.argmax(np.where(allowed, gains, -np.inf)))
+        slot = int(moves.slots[best_move])
+        player_id = int(moves.players[best_move])
+
+        old_player = team[slot]
+        if 0 <= old_player < num_players:
+            in_team[old_player] = False
+            tabu_until[old_player] = step + tenure
+        in_team[player_id] = True
+        team[slot] = player_id
+        fitness = team.fitness
+        if fitness > best_fitness:
+            best_team, best_fitness = list(team), fitness
+        history.append(best_fitness)
+        if stopping is not None and stopping.update(best_fitness) is not None:
+            break
+    return best_team, best_fitness, history, step
@@ -0,0 +1,85 @@
+"""
+暖啟動：把一輪結束時的種群（或最佳球隊）以球員名稱存檔，資料更新（例如季中 → 季末）後再載入當作初始種群的一部分。
+球員編號在不同的數據檔之間不相同，因此存檔時使用名稱，載入時依新的 PlayerIndex 重新對應並修復。
+"""
+import json
+import os
+import tempfile
+import unicodedata
+
+# 存檔格式版本
+POPULATION_VERSION = 1
+
+
+def save_population(path, population, fitness, player_index, season=None):
+    """
+    以球員名稱儲存種群（依 fitness 由高到低），原子寫入。
+    每支球隊：{'fitness': ..., 'players': [名稱, ...]}；找不到的球員編號存成 None。
+    """
+    names = player_index.players['Player'].to_numpy(dtype=object)
+    order = sorted(range(len(population)), key=lambda i: fitness[i], reverse=True)
+    teams = [
+        {
+            'fitness': float(fitness[i]),
+            'players': [names[player_id] if 0 <= player_id < len(names) else None for player_id in population[i]],
+        }
+        for i in order
+    ]
+    payload = {'version': POPULATION_VERSION, 'season': season, 'teams': teams}
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8') as output:
+            json.dump(payload, output, ensure_ascii=False)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_rosters(paths):
+    """讀取一個或多個存檔，回傳球員名稱的球隊串列（各檔依 fitness 由高到低，依檔案順序串接）"""
+    rosters = []
+    for path in paths:
+        with open(path, encoding='utf-8') as handle:
+            payload = json.load(handle)
+        if payload.get('version') != POPULATION_VERSION:
+            raise ValueError(f"Unsupported population file version in {path}")
+        rosters.extend(team['players'] for team in payload['teams'])
+    return rosters
+
+
+def name_keys(name):
+    """
+    比對名稱用的鍵（依序嘗試）：小寫名稱、去除重音符號、所有非 ASCII 字元換成 '?'。
+    部分數據檔把非 ASCII 字元存成 '?'（例如 'Nikola Joki?'），後兩者讓 'Nikola Jokić' 也能對應。
+    """
+    name = name.strip().lower()
+    folded = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    masked = ''.join(char if ord(char) < 128 else '?' for char in name)
+    return name, folded, masked
+
+
+def remap_rosters(rosters, player_index):
+    """
+    依名稱把球隊對應到新數據的球員編號（name_keys 依序比對）；找不到的球員為 -1。
+    回傳 (球隊串列, 找不到的球員數)。
+    """
+    lookups = ({}, {}, {})
+    for player_id, name in enumerate(player_index.names.tolist()):
+        for lookup, key in zip(lookups, name_keys(name)):
+            lookup.setdefault(key, player_id)
+    missing = 0
+    teams = []
+    for roster in rosters:
+        team = []
+        for name in roster:
+            player_id = -1
+            if isinstance(name, str):
+                keys = name_keys(name)
+                player_id = next((lookup[key] for lookup, key in zip(lookups, keys) if key in lookup), -1)
+            missing += player_id < 0
+            team.append(player_id)
+        teams.append(team)
+    return teams, missing